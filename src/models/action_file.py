@@ -19,6 +19,12 @@ from lib.utils import validate_uuid, get_current_iso_timestamp
 from lib.exceptions import ActionFileError, ValidationError
 from lib.constants import PRIORITIES, ACTION_TYPES
 
+# libyaml-backed dumper/loader when available (~10x the pure-Python ones)
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 class ActionFile:
     """
@@ -109,7 +115,7 @@ class ActionFile:
         """
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             
             if data is None:
                 raise ActionFileError(f"Action file {file_path} is empty")
@@ -152,7 +158,12 @@ class ActionFile:
         Returns:
             YAML string representation of the action file
         """
-        return yaml.dump(self.to_dict(), default_flow_style=False, allow_unicode=True)
+        return yaml.dump(
+            self.to_dict(),
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            allow_unicode=True
+        )
     
     def save_to_file(self, file_path: str) -> None:
         """
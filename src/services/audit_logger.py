@@ -4,6 +4,7 @@ Comprehensive audit logging for approvals, rejections, and execution traces
 """
 import logging
 import json
+import uuid
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -17,6 +18,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.utils import get_current_iso_timestamp, ensure_directory_exists
 from lib.event_bus import EventType, get_event_bus, Event
 
+# orjson serializes in native code, several times faster than stdlib
+# json; fall back transparently when it is not installed
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 class AuditEventType(Enum):
     """Types of audit events."""
@@ -177,7 +185,7 @@ class AuditLogger:
         self._load_config()
         self._setup_event_handlers()
         
-        self.logger.info(f"AuditLogger initialized (vault: {vault_path})")
+        self.logger.info("AuditLogger initialized (vault: %s)", vault_path)
     
     def _ensure_directories(self):
         """Ensure audit directories exist."""
@@ -253,6 +261,10 @@ class AuditLogger:
         Args:
             entry: Audit entry to log
         """
+        # Bound detail payloads before they are buffered or written
+        if entry.details:
+            entry.details = self._bound_details(entry.details)
+
         # Add to buffer
         self._buffer.append(entry)
         if len(self._buffer) > self._buffer_size:
@@ -264,12 +276,93 @@ class AuditLogger:
         # Write to appropriate log file
         self._write_entry(entry)
         
-        self.logger.debug(f"Audit entry logged: {entry.event_type.value}")
-    
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Audit entry logged: %s", entry.event_type.value)
+
+    def log_batch(self, entries: List[AuditEntry]):
+        """
+        Log several audit entries in one pass.
+
+        Amortizes the per-entry file open: each log file is opened once
+        for the whole batch instead of once per entry.
+
+        Args:
+            entries: Audit entries to log
+        """
+        if not entries:
+            return
+
+        for entry in entries:
+            if entry.details:
+                entry.details = self._bound_details(entry.details)
+
+        self._buffer.extend(entries)
+        if len(self._buffer) > self._buffer_size:
+            self._buffer = self._buffer[-self._buffer_size:]
+
+        self._stats["total_entries"] += len(entries)
+
+        general_lines = []
+        approval_lines = []
+        execution_lines = []
+        for entry in entries:
+            entry_json = self._serialize_entry(entry)
+            general_lines.append(entry_json)
+
+            if isinstance(entry, ApprovalAuditEntry) or entry.event_type.value.startswith('approval'):
+                self._stats["approval_events"] += 1
+                if entry.event_type == EventType.APPROVAL_REJECTED:
+                    self._stats["rejections"] += 1
+                approval_lines.append(entry_json)
+
+            elif isinstance(entry, ExecutionAuditEntry) or entry.event_type.value.startswith('execution'):
+                self._stats["execution_events"] += 1
+                if entry.event_type == EventType.EXECUTION_ROLLED_BACK:
+                    self._stats["rollbacks"] += 1
+                execution_lines.append(entry_json)
+
+        with open(self.general_log_path, 'a', encoding='utf-8') as f:
+            f.writelines(general_lines)
+        if approval_lines:
+            with open(self.approval_log_path, 'a', encoding='utf-8') as f:
+                f.writelines(approval_lines)
+        if execution_lines:
+            with open(self.execution_log_path, 'a', encoding='utf-8') as f:
+                f.writelines(execution_lines)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Audit batch logged: %d entries", len(entries))
+
+    # Cap on serialized detail payloads; a runaway context dict should
+    # not turn one audit line into megabytes of JSONL
+    MAX_DETAIL_CHARS = 2048
+
+    @classmethod
+    def _bound_details(cls, details: Dict[str, Any]) -> Dict[str, Any]:
+        """Truncate oversized detail payloads to a bounded preview."""
+        try:
+            text = json.dumps(details, default=str)
+        except (TypeError, ValueError):
+            text = str(details)
+        if len(text) <= cls.MAX_DETAIL_CHARS:
+            return details
+        return {"truncated": True, "preview": text[:cls.MAX_DETAIL_CHARS]}
+
+    @staticmethod
+    def _serialize_entry(entry: AuditEntry) -> str:
+        """Serialize an entry to one JSONL line (newline included)."""
+        entry_dict = entry.to_dict()
+        if _orjson is not None:
+            try:
+                return _orjson.dumps(entry_dict).decode('utf-8') + "\n"
+            except TypeError:
+                # Detail payloads may carry types orjson refuses
+                pass
+        return json.dumps(entry_dict, default=str) + "\n"
+
     def _write_entry(self, entry: AuditEntry):
         """Write entry to log files."""
-        entry_dict = entry.to_dict()
-        entry_json = json.dumps(entry_dict) + "\n"
+        entry_json = self._serialize_entry(entry)
         
         # Write to general audit log
         with open(self.general_log_path, 'a', encoding='utf-8') as f:
@@ -302,7 +395,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log an approval request."""
-        import uuid
         entry = ApprovalAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.APPROVAL_REQUESTED,
@@ -329,7 +421,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log an approval granted."""
-        import uuid
         entry = ApprovalAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.APPROVAL_GRANTED,
@@ -338,7 +429,7 @@ class AuditLogger:
             action_id=action_id,
             plan_id=plan_id,
             approval_id=approval_id,
-            details=details or {},
+            details=details if details is not None else {},
             decision="approved",
             reason=reason,
             approver=approver,
@@ -359,7 +450,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log an approval rejected."""
-        import uuid
         entry = ApprovalAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.APPROVAL_REJECTED,
@@ -368,7 +458,7 @@ class AuditLogger:
             action_id=action_id,
             plan_id=plan_id,
             approval_id=approval_id,
-            details=details or {},
+            details=details if details is not None else {},
             decision="rejected",
             reason=reason,
             approver=approver,
@@ -389,7 +479,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log an approval escalated."""
-        import uuid
         entry = ApprovalAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.APPROVAL_ESCALATED,
@@ -419,7 +508,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log execution started."""
-        import uuid
         entry = ExecutionAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.EXECUTION_STARTED,
@@ -428,7 +516,7 @@ class AuditLogger:
             action_id=action_id,
             plan_id=plan_id,
             correlation_id=correlation_id,
-            details=details or {},
+            details=details if details is not None else {},
             execution_mode=execution_mode
         )
         self.log(entry)
@@ -448,7 +536,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log execution completed."""
-        import uuid
         entry = ExecutionAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.EXECUTION_COMPLETED,
@@ -478,7 +565,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log execution failed."""
-        import uuid
         entry = ExecutionAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.EXECUTION_FAILED,
@@ -487,7 +573,7 @@ class AuditLogger:
             action_id=action_id,
             plan_id=plan_id,
             correlation_id=correlation_id,
-            details=details or {},
+            details=details if details is not None else {},
             error_message=error
         )
         self.log(entry)
@@ -507,7 +593,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log a step execution."""
-        import uuid
         event_type = AuditEventType.STEP_EXECUTED if status == "completed" else AuditEventType.STEP_FAILED
         
         entry = ExecutionAuditEntry(
@@ -517,7 +602,7 @@ class AuditLogger:
             actor=actor,
             action_id=action_id,
             plan_id=plan_id,
-            details=details or {},
+            details=details if details is not None else {},
             execution_mode=execution_mode,
             step_number=step_number,
             step_description=step_description,
@@ -538,7 +623,6 @@ class AuditLogger:
         details: Dict[str, Any] = None
     ) -> str:
         """Log a rollback operation."""
-        import uuid
         entry = ExecutionAuditEntry(
             entry_id=str(uuid.uuid4()),
             event_type=AuditEventType.EXECUTION_ROLLED_BACK,
@@ -693,7 +777,7 @@ class AuditLogger:
                         continue
                         
         except Exception as e:
-            self.logger.error(f"Error reading log file: {e}")
+            self.logger.error("Error reading log file: %s", e)
         
         return results
     
@@ -731,7 +815,7 @@ class AuditLogger:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(entries, f, indent=2)
         
-        self.logger.info(f"Exported {len(entries)} audit entries to {output_path}")
+        self.logger.info("Exported %d audit entries to %s", len(entries), output_path)
         return len(entries)
 
 
@@ -3,10 +3,14 @@ Dashboard AutoUpdater - Gold Tier
 Automatically updates Dashboard.md with real-time workflow status
 """
 import asyncio
+import functools
+import json
 import logging
+import os
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import yaml
 
 import sys
@@ -15,6 +19,40 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.event_bus import get_event_bus, EventType, Event, publish_event
 from lib.utils import get_current_iso_timestamp, ensure_directory_exists
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed configs cached by (path, mtime) so repeat loads are a dict lookup
+_CONFIG_CACHE: Dict[Any, Dict[str, Any]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_for_second(sec: int) -> str:
+    # strftime keeps the naive-UTC "...Z" shape get_current_iso_timestamp
+    # emits; an aware isoformat() would append "+00:00" instead
+    return datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+
+
+def get_current_iso_timestamp_fast() -> str:
+    """ISO timestamp cached at 1-second granularity for event bursts."""
+    return _iso_for_second(int(time.time()))
+
+
+def _load_yaml_config(config_path: str) -> Dict[str, Any]:
+    """Load a YAML config file, cached by path and modification time."""
+    cache_key = (config_path, os.path.getmtime(config_path))
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader) or {}
+
+    _CONFIG_CACHE[cache_key] = config
+    return config
+
 
 class DashboardAutoUpdater:
     """
@@ -34,6 +72,7 @@ class DashboardAutoUpdater:
         self.config = {}
         
         self.dashboard_path = self.vault_path / "Dashboard.md"
+        self.state_path = self.vault_path / ".dashboard_state.json"
         self.logger = logging.getLogger("DashboardAutoUpdater")
         self.event_bus = get_event_bus()
         
@@ -41,6 +80,7 @@ class DashboardAutoUpdater:
         self._running = False
         self._update_interval = 30  # seconds
         self._update_task: Optional[asyncio.Task] = None
+        self._dir_ok = False  # vault dir verified once, then skipped
         
         # Metrics (cached)
         self._metrics = {
@@ -70,10 +110,18 @@ class DashboardAutoUpdater:
         # Recent activity log
         self._recent_activity: List[Dict[str, Any]] = []
         self._max_activity_log = 20
-        
+
+        # Cached render fragments, rebuilt only when their inputs change
+        self._watcher_text = ""
+        self._activity_text = "- No recent activity"
+        self._rebuild_watcher_text()
+
         # Load config
         self._load_config()
-        
+
+        # Restore persisted state so a restart doesn't need a full scan
+        self._load_state()
+
         # Setup event handlers
         self._setup_event_handlers()
         
@@ -82,12 +130,41 @@ class DashboardAutoUpdater:
     def _load_config(self):
         """Load configuration."""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-            
+            self.config = _load_yaml_config(self.config_path)
             self._update_interval = self.config.get('dashboard', {}).get('update_interval', 30)
         except:
             self.config = {}
+
+    def _load_state(self):
+        """Restore metrics and activity persisted by a previous run."""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+
+            # Only trust recent state; stale counts get re-scanned anyway
+            if time.time() - state.get('saved_at', 0) > 300:
+                return
+
+            self._metrics.update(state.get('metrics', {}))
+            self._recent_activity = list(state.get('activity', []))[:self._max_activity_log]
+            self._rebuild_activity_text()
+
+            self.logger.debug("Dashboard state restored from previous run")
+        except (OSError, ValueError):
+            pass
+
+    def _save_state(self):
+        """Persist metrics and activity for the next run."""
+        try:
+            state = {
+                'metrics': self._metrics,
+                'activity': list(self._recent_activity),
+                'saved_at': time.time()
+            }
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError as e:
+            self.logger.warning(f"Could not persist dashboard state: {e}")
     
     def _setup_event_handlers(self):
         """Setup event bus handlers."""
@@ -109,9 +186,10 @@ class DashboardAutoUpdater:
         
         if service in self._watchers:
             self._watchers[service]['active'] = (event.event_type == EventType.SERVICE_STARTED)
-            self._watchers[service]['last_seen'] = get_current_iso_timestamp()
+            self._watchers[service]['last_seen'] = get_current_iso_timestamp_fast()
             
             self.logger.debug(f"Service {service}: {event.event_type.value}")
+            self._rebuild_watcher_text()
             self._schedule_update()
     
     def _on_file_event(self, event: Event):
@@ -151,11 +229,37 @@ class DashboardAutoUpdater:
     
     def _add_activity(self, activity: Dict[str, Any]):
         """Add activity to the recent activity log."""
+        # Pay formatting costs once at insert time so the render path
+        # reads precomputed fields
+        activity['_event_lc'] = activity.get('event', '').lower()
+        activity['_ts_short'] = activity.get('timestamp', '')[:19]
         self._recent_activity.insert(0, activity)
-        
+
         # Trim to max size
         if len(self._recent_activity) > self._max_activity_log:
             self._recent_activity = self._recent_activity[:self._max_activity_log]
+
+        self._rebuild_activity_text()
+
+    def _rebuild_watcher_text(self):
+        """Rebuild the cached watcher status fragment."""
+        lines = []
+        for name, status in self._watchers.items():
+            icon = "🟢" if status['active'] else "🔴"
+            state = 'Running' if status['active'] else 'Stopped'
+            lines.append(f"- **{name.replace('_', ' ').title()}**: {icon} {state}")
+        self._watcher_text = "\n".join(lines) + "\n"
+
+    def _rebuild_activity_text(self):
+        """Rebuild the cached recent activity fragment."""
+        activity_lines = []
+        for activity in self._recent_activity[:10]:
+            event_type = activity.get('event', 'unknown').replace('_', ' ').title()
+            filename = activity.get('filename') or activity.get('action_id') or activity.get('plan_id')
+            timestamp = activity.get('_ts_short') or activity.get('timestamp', '')[:19]
+            activity_lines.append(f"- {timestamp}: {event_type} - {filename}")
+
+        self._activity_text = "\n".join(activity_lines) if activity_lines else "- No recent activity"
     
     def _schedule_update(self):
         """Schedule a dashboard update."""
@@ -194,7 +298,10 @@ class DashboardAutoUpdater:
         
         # Final update
         await self._update_dashboard()
-        
+
+        # Persist state for fast restart
+        self._save_state()
+
         self.logger.info("DashboardAutoUpdater stopped")
         
         publish_event(
@@ -249,12 +356,17 @@ class DashboardAutoUpdater:
             "Approved", "Done", "Failed", "Dead_Letter"
         ]
         
-        for folder in folders:
-            folder_path = self.vault_path / folder
-            if folder_path.exists():
-                count = sum(1 for f in folder_path.iterdir() if f.is_file())
+        # Fan the folder scans out to threads so the event loop keeps
+        # serving callbacks and wall-clock time is the slowest scan,
+        # not the sum of all of them
+        counts = await asyncio.gather(
+            *(asyncio.to_thread(self._count_folder, folder) for folder in folders)
+        )
+
+        for folder, count in zip(folders, counts):
+            if count is not None:
                 self._metrics[f"{folder.lower()}_count"] = count
-        
+
         # Calculate totals
         self._metrics['total_actions'] = (
             self._metrics['inbox_count'] +
@@ -272,28 +384,26 @@ class DashboardAutoUpdater:
             'completed' in a.get('event', '').lower()
         )
         
-        self._metrics['last_updated'] = get_current_iso_timestamp()
-    
+        self._metrics['last_updated'] = get_current_iso_timestamp_fast()
+
+    def _count_folder(self, folder: str) -> Optional[int]:
+        """Count files in a vault folder. Returns None if the folder is missing."""
+        folder_path = self.vault_path / folder
+        try:
+            with os.scandir(folder_path) as it:
+                return sum(1 for entry in it if entry.is_file(follow_symlinks=False))
+        except OSError:
+            return None
+
     def _generate_dashboard_content(self) -> str:
         """Generate Dashboard.md content."""
         m = self._metrics
-        
-        # Watcher status
-        watcher_status = ""
-        for name, status in self._watchers.items():
-            icon = "🟢" if status['active'] else "🔴"
-            last_seen = status['last_seen'] or 'Never'
-            watcher_status += f"- **{name.replace('_', ' ').title()}**: {icon} {status['active'] and 'Running' or 'Stopped'}\n"
-        
-        # Recent activity
-        activity_lines = []
-        for activity in self._recent_activity[:10]:
-            event_type = activity.get('event', 'unknown').replace('_', ' ').title()
-            filename = activity.get('filename') or activity.get('action_id') or activity.get('plan_id')
-            activity_lines.append(f"- {activity['timestamp'][:19]}: {event_type} - {filename}")
-        
-        activity_text = "\n".join(activity_lines) if activity_lines else "- No recent activity"
-        
+
+        # Watcher status and recent activity are cached fragments,
+        # rebuilt only when watchers change or activity is added
+        watcher_status = self._watcher_text
+        activity_text = self._activity_text
+
         # Error status
         error_status = "✅ No errors" if m['errors_today'] == 0 else f"⚠️ {m['errors_today']} errors today"
         
@@ -352,20 +462,17 @@ class DashboardAutoUpdater:
         """Calculate success rate from recent activity."""
         if not self._recent_activity:
             return 100.0
-        
-        completed = sum(
-            1 for a in self._recent_activity
-            if 'completed' in a.get('event', '').lower() or
-               'executed' in a.get('event', '').lower() or
-               'approved' in a.get('event', '').lower()
-        )
-        
-        failed = sum(
-            1 for a in self._recent_activity
-            if 'failed' in a.get('event', '').lower() or
-               'error' in a.get('event', '').lower()
-        )
-        
+
+        # Single pass over the log using the lowercase event cached at insert
+        completed = 0
+        failed = 0
+        for a in self._recent_activity:
+            event = a.get('_event_lc', '')
+            if 'failed' in event or 'error' in event:
+                failed += 1
+            elif 'completed' in event or 'executed' in event or 'approved' in event:
+                completed += 1
+
         total = completed + failed
         if total == 0:
             return 100.0
@@ -374,16 +481,22 @@ class DashboardAutoUpdater:
     
     def _write_dashboard_atomic(self, content: str):
         """Write dashboard content atomically."""
-        ensure_directory_exists(str(self.vault_path))
-        
-        # Write to temp file first
+        if not self._dir_ok:
+            ensure_directory_exists(str(self.vault_path))
+            self._dir_ok = True
+
+        # Write to temp file first - single write() syscall, no buffering layer
         temp_path = self.dashboard_path.with_suffix('.md.tmp')
-        
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        data = content.encode('utf-8')
+
+        fd = os.open(str(temp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
         # Atomic rename
-        temp_path.rename(self.dashboard_path)
+        os.replace(temp_path, self.dashboard_path)
     
     def force_update(self):
         """Force an immediate dashboard update."""
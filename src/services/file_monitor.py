@@ -3,127 +3,290 @@ File Monitor Service - Gold Tier
 Event-driven filesystem watcher using watchdog
 """
 import asyncio
+import concurrent.futures
+import itertools
 import logging
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifiedEvent, FileMovedEvent, FileDeletedEvent
+import re
 import yaml
 import time
+import threading
 
 # Add the src directory to the path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib.event_bus import EventType, publish_event, get_event_bus
+
+try:
+    from lib.event_bus import publish_event_batch
+except ImportError:
+    def publish_event_batch(events):
+        """Fallback for event buses without native batch publish."""
+        for event_type, payload, source in events:
+            publish_event(event_type, payload, source=source)
 from lib.utils import get_current_iso_timestamp, ensure_directory_exists
 from lib.constants import ACTION_FILE_EXT
 from models.action_file import ActionFile
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed configs cached by (path, mtime) so repeat loads are a dict lookup
+_CONFIG_CACHE: Dict[Any, Dict[str, Any]] = {}
+
+
+def _load_yaml_config(config_path: str) -> Dict[str, Any]:
+    """Load a YAML config file, cached by path and modification time."""
+    cache_key = (config_path, os.path.getmtime(config_path))
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader) or {}
+
+    _CONFIG_CACHE[cache_key] = config
+    return config
+
 
 class FileEventHandler(FileSystemEventHandler):
-    """Handler for file system events with event bus integration."""
-    
-    def __init__(self, folder_name: str, event_bus, logger: logging.Logger):
-        self.folder_name = folder_name
+    """
+    Handler for file system events with event bus integration.
+
+    One instance watches the whole vault recursively; events are mapped
+    back to their workflow folder by the parent-directory name, and
+    anything outside the monitored folders is dropped early.
+    """
+
+    def __init__(self, monitored_folders, event_bus, logger: logging.Logger):
+        self.monitored_folders = set(monitored_folders)
         self.event_bus = event_bus
         self.logger = logger
-        self._debounce: Dict[str, float] = {}
+        self._source = "file_monitor"
+
+        # Flat event-type -> bound-method table so dispatch is a single
+        # dict probe instead of watchdog's per-event getattr
+        self._dispatch_table = {
+            'created': self.on_created,
+            'modified': self.on_modified,
+            'moved': self.on_moved,
+            'deleted': self.on_deleted,
+        }
+        # LRU-ordered debounce map, bounded so long-running monitors
+        # don't accumulate one entry per unique path ever seen.
+        # Values are monotonic nanoseconds - immune to wall-clock skew.
+        self._debounce: "OrderedDict[str, int]" = OrderedDict()
         self._debounce_interval = 0.5  # seconds
-    
+        self._debounce_interval_ns = int(self._debounce_interval * 1e9)
+        self._debounce_max_entries = 4096
+
+        # Pending events coalesced per watchdog dispatch burst, so a storm
+        # of callbacks costs one bus dispatch instead of one per file.
+        # Keyed by (event_type, path): only the latest event of each type
+        # per path survives a burst (editor save = write+rename+chmod).
+        self._pending: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_quiescence = 0.2  # flush after this much quiet
+        self._flush_cap = 0.5         # but never hold a burst longer
+        self._burst_start = 0.0
+        self._last_flush = 0.0
+
+        # Destinations of recent moves: some platforms emit a spurious
+        # created event right after a moved event for the same path
+        self._recent_moves: Dict[str, float] = {}
+        self._recent_move_window = 0.5  # seconds
+
+    def dispatch(self, event):
+        """Route a watchdog event through the precomputed table."""
+        if event.is_directory:
+            return
+        handler = self._dispatch_table.get(event.event_type)
+        if handler is not None:
+            handler(event)
+
+    def _resolve_folder(self, path: str) -> Optional[str]:
+        """Map a path to its monitored workflow folder, or None."""
+        folder = os.path.basename(os.path.dirname(path))
+        if folder in self.monitored_folders:
+            return folder
+        return None
+
+    def _enqueue_event(self, event_type, payload: Dict[str, Any]):
+        """Queue an event, dedup within the burst, and (re)arm the flush."""
+        now = time.monotonic()
+        flush_now = False
+
+        with self._pending_lock:
+            first_of_burst = (
+                not self._pending
+                and self._flush_timer is None
+                and now - self._last_flush >= self._flush_quiescence
+            )
+            key = (event_type, payload.get('path') or payload.get('dest_path'))
+            self._pending[key] = (event_type, payload, self._source)
+
+            if first_of_burst:
+                # Fast path: the first event of a burst goes out immediately
+                self._burst_start = now
+                flush_now = True
+            elif self._pending and now - self._burst_start >= self._flush_cap:
+                # Hard cap: don't hold a sustained burst indefinitely
+                flush_now = True
+            else:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                self._flush_timer = threading.Timer(
+                    self._flush_quiescence, self._flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if flush_now:
+            self._flush()
+
+    def _flush(self):
+        """Publish all queued events as one batch."""
+        with self._pending_lock:
+            batch = list(self._pending.values())
+            self._pending = OrderedDict()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._last_flush = time.monotonic()
+            self._burst_start = self._last_flush
+
+            # Expire stale move records alongside the flush
+            if self._recent_moves:
+                cutoff = self._last_flush - self._recent_move_window
+                self._recent_moves = {
+                    path: ts for path, ts in self._recent_moves.items()
+                    if ts >= cutoff
+                }
+
+        if batch:
+            publish_event_batch(batch)
+
     def _should_process(self, path: str) -> bool:
         """Debounce rapid file events."""
-        now = time.time()
-        last_time = self._debounce.get(path, 0)
-        
-        if now - last_time < self._debounce_interval:
+        now_ns = time.monotonic_ns()
+        last_ns = self._debounce.get(path, 0)
+
+        # Rejected events leave the map untouched - no dirty write
+        if now_ns - last_ns < self._debounce_interval_ns:
             return False
-        
-        self._debounce[path] = now
+
+        self._debounce[path] = now_ns
+        self._debounce.move_to_end(path)
+
+        # Evict oldest entries beyond the cap
+        while len(self._debounce) > self._debounce_max_entries:
+            self._debounce.popitem(last=False)
+
+        # Lazy GC: drop stale entries from the oldest few items; islice
+        # stops after 16 instead of materializing the whole map
+        stale_before_ns = now_ns - (10 * self._debounce_interval_ns)
+        stale_paths = [
+            p for p, t in itertools.islice(self._debounce.items(), 16)
+            if t < stale_before_ns
+        ]
+        for stale_path in stale_paths:
+            del self._debounce[stale_path]
+
         return True
     
+    def _dispatch_simple(self, event_type, src_path: str,
+                         debounce: bool = True, with_size: bool = False):
+        """
+        Shared path for created/modified/deleted events: resolve the
+        folder, debounce, and enqueue - one code path instead of three
+        near-identical handler bodies.
+        """
+        folder = self._resolve_folder(src_path)
+        if folder is None:
+            return
+
+        if debounce and not self._should_process(src_path):
+            return
+
+        filename = os.path.basename(src_path)
+        self.logger.debug("%s in %s: %s", event_type.value, folder, filename)
+
+        payload = {
+            "path": src_path,
+            "filename": filename,
+            "folder": folder
+        }
+        if with_size:
+            try:
+                payload["size"] = os.path.getsize(src_path)
+            except OSError:
+                payload["size"] = 0
+
+        self._enqueue_event(event_type, payload)
+
     def on_created(self, event):
         """Handle file creation events."""
         if event.is_directory:
             return
-        
-        if not self._should_process(event.src_path):
+
+        # Suppress the duplicate create that can follow a move
+        moved_at = self._recent_moves.get(event.src_path)
+        if moved_at is not None and time.monotonic() - moved_at < self._recent_move_window:
             return
-        
-        file_path = Path(event.src_path)
-        self.logger.debug(f"File created in {self.folder_name}: {file_path.name}")
-        
-        publish_event(
-            EventType.FILE_CREATED,
-            {
-                "path": str(file_path),
-                "filename": file_path.name,
-                "folder": self.folder_name,
-                "size": file_path.stat().st_size if file_path.exists() else 0
-            },
-            source=f"file_monitor.{self.folder_name}"
-        )
-    
+
+        self._dispatch_simple(EventType.FILE_CREATED, event.src_path, with_size=True)
+
     def on_modified(self, event):
         """Handle file modification events."""
         if event.is_directory:
             return
-        
-        if not self._should_process(event.src_path):
-            return
-        
-        file_path = Path(event.src_path)
-        self.logger.debug(f"File modified in {self.folder_name}: {file_path.name}")
-        
-        publish_event(
-            EventType.FILE_MODIFIED,
-            {
-                "path": str(file_path),
-                "filename": file_path.name,
-                "folder": self.folder_name
-            },
-            source=f"file_monitor.{self.folder_name}"
-        )
+
+        self._dispatch_simple(EventType.FILE_MODIFIED, event.src_path)
     
     def on_moved(self, event):
         """Handle file move events."""
         if event.is_directory:
             return
         
-        src_path = Path(event.src_path)
-        dest_path = Path(event.dest_path)
-        
-        self.logger.debug(f"File moved: {src_path.name} -> {dest_path}")
-        
-        publish_event(
+        src_path = event.src_path
+        dest_path = event.dest_path
+
+        src_folder = self._resolve_folder(src_path)
+        dest_folder = self._resolve_folder(dest_path)
+        if src_folder is None and dest_folder is None:
+            return
+
+        self.logger.debug("File moved: %s -> %s", os.path.basename(src_path), dest_path)
+
+        self._recent_moves[dest_path] = time.monotonic()
+
+        self._enqueue_event(
             EventType.FILE_MOVED,
             {
-                "src_path": str(src_path),
-                "dest_path": str(dest_path),
-                "filename": dest_path.name,
-                "src_folder": src_path.parent.name,
-                "dest_folder": dest_path.parent.name
-            },
-            source=f"file_monitor.{self.folder_name}"
+                "src_path": src_path,
+                "dest_path": dest_path,
+                "filename": os.path.basename(dest_path),
+                "src_folder": src_folder or os.path.basename(os.path.dirname(src_path)),
+                "dest_folder": dest_folder or os.path.basename(os.path.dirname(dest_path))
+            }
         )
     
     def on_deleted(self, event):
         """Handle file deletion events."""
         if event.is_directory:
             return
-        
-        file_path = Path(event.src_path)
-        self.logger.debug(f"File deleted in {self.folder_name}: {file_path.name}")
-        
-        publish_event(
-            EventType.FILE_DELETED,
-            {
-                "path": str(file_path),
-                "filename": file_path.name,
-                "folder": self.folder_name
-            },
-            source=f"file_monitor.{self.folder_name}"
-        )
+
+        self._dispatch_simple(EventType.FILE_DELETED, event.src_path, debounce=False)
 
 
 class FileMonitor:
@@ -154,7 +317,13 @@ class FileMonitor:
         # Metrics
         self._events_processed = 0
         self._actions_created = 0
-        
+
+        # Worker pool for blocking file I/O so inbox processing never
+        # stalls the event loop
+        self._io_pool: Optional[concurrent.futures.ThreadPoolExecutor] = (
+            self._create_io_pool()
+        )
+
         # Load configuration
         self._load_config()
         
@@ -166,11 +335,9 @@ class FileMonitor:
     def _load_config(self):
         """Load configuration."""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-            
+            self.config = _load_yaml_config(self.config_path)
             self.vault_path = self.config.get('app', {}).get('vault_path', './AI_Employee_Vault')
-            
+
         except Exception as e:
             self.logger.warning(f"Could not load config: {e}")
             self.vault_path = './AI_Employee_Vault'
@@ -212,7 +379,7 @@ class FileMonitor:
         filename = event.payload.get('filename', '')
         
         self._events_processed += 1
-        self.logger.info(f"Workflow transition: {filename} ({src_folder} -> {dest_folder})")
+        self.logger.info("Workflow transition: %s (%s -> %s)", filename, src_folder, dest_folder)
         
         # Track specific transitions
         if dest_folder == 'Approved':
@@ -236,19 +403,23 @@ class FileMonitor:
             file_path: Path to the inbox file
         """
         try:
-            self.logger.info(f"Processing inbox file: {file_path.name}")
+            self.logger.info("Processing inbox file: %s", file_path.name)
             
-            # Read file content
+            # Read the bytes once and decode, instead of re-reading the
+            # whole file on a UTF-8 failure
+            loop = asyncio.get_running_loop()
+
             content = ""
             if file_path.exists():
+                data = await loop.run_in_executor(self._io_pool, file_path.read_bytes)
                 try:
-                    content = file_path.read_text(encoding='utf-8')
-                except:
-                    content = file_path.read_text(encoding='latin-1')
-            
+                    content = data.decode('utf-8')
+                except UnicodeDecodeError:
+                    content = data.decode('utf-8', errors='replace')
+
             # Determine action type based on content/filename
             action_type = self._determine_action_type(file_path.name, content)
-            
+
             # Create action file
             action = ActionFile(
                 action_type=action_type,
@@ -268,10 +439,10 @@ class FileMonitor:
             action_filename = f"{action.id}.action.yaml"
             action_path = needs_action_path / action_filename
             
-            action.save_to_file(str(action_path))
-            
+            await loop.run_in_executor(self._io_pool, action.save_to_file, str(action_path))
+
             self._actions_created += 1
-            self.logger.info(f"Action file created: {action_path.name}")
+            self.logger.info("Action file created: %s", action_path.name)
             
             # Publish action generated event
             publish_event(
@@ -291,63 +462,103 @@ class FileMonitor:
         except Exception as e:
             self.logger.error(f"Error processing inbox file {file_path.name}: {e}")
     
+    # Case-insensitive classifiers compiled once: no lowercase copy of
+    # the (possibly large) file content is allocated per call
+    _FILENAME_RE = re.compile(
+        r'(?P<meeting_request>meeting|calendar)'
+        r'|(?P<report_generation>report)'
+        r'|(?P<data_analysis>analysis|data)'
+        r'|(?P<document_creation>doc|document)',
+        re.IGNORECASE
+    )
+    _CONTENT_RE = re.compile(
+        r'(?P<meeting_request>meeting|schedule)'
+        r'|(?P<report_generation>report|summary)'
+        r'|(?P<data_analysis>analyze|analysis)'
+        r'|(?P<document_creation>document|create)'
+        r'|(?P<follow_up>follow[- ]up)',
+        re.IGNORECASE
+    )
+
+    @staticmethod
+    def _rank_match(pattern, text: str):
+        """Highest-priority category hit: earliest-declared group wins,
+        not the leftmost keyword, preserving the original ordered-list
+        precedence ('meeting notes.doc' is a meeting, not a document)."""
+        return min(pattern.finditer(text),
+                   key=lambda m: m.lastindex, default=None)
+
     def _determine_action_type(self, filename: str, content: str) -> str:
         """Determine action type based on filename and content."""
-        filename_lower = filename.lower()
-        content_lower = content.lower()
-        
         # Check filename patterns
-        if 'meeting' in filename_lower or 'calendar' in filename_lower:
-            return 'meeting_request'
-        elif 'report' in filename_lower:
-            return 'report_generation'
-        elif 'analysis' in filename_lower or 'data' in filename_lower:
-            return 'data_analysis'
-        elif 'doc' in filename_lower or 'document' in filename_lower:
-            return 'document_creation'
-        
-        # Check content patterns
-        if 'meeting' in content_lower or 'schedule' in content_lower:
-            return 'meeting_request'
-        elif 'report' in content_lower or 'summary' in content_lower:
-            return 'report_generation'
-        elif 'analyze' in content_lower or 'analysis' in content_lower:
-            return 'data_analysis'
-        elif 'document' in content_lower or 'create' in content_lower:
-            return 'document_creation'
-        elif 'follow up' in content_lower or 'follow-up' in content_lower:
-            return 'follow_up'
-        
+        match = self._rank_match(self._FILENAME_RE, filename)
+        if match:
+            return match.lastgroup
+
+        # Check content patterns - keywords past 2 KB are noise
+        match = self._rank_match(self._CONTENT_RE, content[:2000])
+        if match:
+            return match.lastgroup
+
         return 'email_response'  # Default
     
+    @staticmethod
+    def _create_io_pool() -> concurrent.futures.ThreadPoolExecutor:
+        """Build the blocking-I/O worker pool."""
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="file_monitor_io"
+        )
+
     def start(self):
         """Start the file monitor."""
         if self._running:
             self.logger.warning("FileMonitor already running")
             return
-        
+
         self._running = True
-        
+
+        # A shut-down executor cannot be restarted: rebuild it after a
+        # stop()/start() cycle, mirroring the Observer rebuild below
+        if self._io_pool is None:
+            self._io_pool = self._create_io_pool()
+
         # Create observer
         self._observer = Observer()
-        
+
         # Setup folders to monitor
         folders = ['Inbox', 'Needs_Action', 'Plans', 'Pending_Approval', 'Approved', 'Done']
-        
+
         for folder_name in folders:
             folder_path = Path(self.vault_path) / folder_name
             ensure_directory_exists(str(folder_path))
-            
-            # Create handler for this folder
-            handler = FileEventHandler(folder_name, self.event_bus, self.logger)
-            self._handlers[folder_name] = handler
-            
-            # Schedule monitoring
-            self._observer.schedule(handler, str(folder_path), recursive=False)
-            self.logger.debug(f"Monitoring folder: {folder_name}")
-        
-        # Start observer
-        self._observer.start()
+            self.logger.debug("Monitoring folder: %s", folder_name)
+
+        # One shared handler on a single recursive watch of the vault
+        # root: one schedule instead of six, and one dispatch path.
+        # The handler filters events down to the monitored folders.
+        handler = FileEventHandler(folders, self.event_bus, self.logger)
+        self._handlers['vault'] = handler
+
+        watcher_config = self.config.get('watcher', {})
+        force_polling = watcher_config.get('force_polling', False)
+        poll_timeout = watcher_config.get('observer_poll_interval', 2.0)
+
+        if force_polling:
+            self._observer = PollingObserver(timeout=poll_timeout)
+
+        self._observer.schedule(handler, str(self.vault_path), recursive=True)
+
+        # Start observer; fall back to polling when the kernel refuses
+        # more inotify watches (ENOSPC from fs.inotify.max_user_watches)
+        try:
+            self._observer.start()
+        except OSError as e:
+            self.logger.warning(
+                f"Native observer failed ({e}), falling back to polling"
+            )
+            self._observer = PollingObserver(timeout=poll_timeout)
+            self._observer.schedule(handler, str(self.vault_path), recursive=True)
+            self._observer.start()
         
         self.logger.info("FileMonitor started")
         
@@ -368,7 +579,11 @@ class FileMonitor:
             self._observer.stop()
             self._observer.join(timeout=5)
             self._observer = None
-        
+
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+
         self.logger.info("FileMonitor stopped")
         
         publish_event(
@@ -393,7 +608,9 @@ class FileMonitor:
         return {
             "events_processed": self._events_processed,
             "actions_created": self._actions_created,
-            "folders_monitored": len(self._handlers),
+            "folders_monitored": sum(
+                len(h.monitored_folders) for h in self._handlers.values()
+            ),
             "vault_path": self.vault_path,
             "observer_alive": self._observer.is_alive() if self._observer else False
         }
@@ -3,9 +3,13 @@ Gmail Watcher Service - Gold Tier
 Event-driven email monitoring with OAuth2 authentication
 """
 import asyncio
+import functools
+import json
 import logging
 import os
+import re
 import base64
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -21,6 +25,32 @@ from lib.constants import ENV_GMAIL_CLIENT_ID, ENV_GMAIL_CLIENT_SECRET, ENV_GMAI
 from lib.exceptions import GmailWatcherError, AuthenticationError
 from models.action_file import ActionFile
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config once per (path, mtime); reused across instances."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+@functools.lru_cache(maxsize=1)
+def _gmail_env_credentials() -> tuple:
+    """Read the Gmail credential env vars once per process.
+
+    Watchers created per inbox share the tuple instead of re-querying
+    the environment on every construction.
+    """
+    return (
+        os.getenv(ENV_GMAIL_CLIENT_ID),
+        os.getenv(ENV_GMAIL_CLIENT_SECRET),
+        os.getenv(ENV_GMAIL_REFRESH_TOKEN),
+    )
+
 
 class GmailWatcher:
     """
@@ -32,7 +62,36 @@ class GmailWatcher:
     - Publish events to the event bus
     - Handle OAuth2 authentication
     """
-    
+
+    # Precompiled keyword scanners: one C-level pass over the content
+    # instead of repeated substring searches per keyword list
+    _ACTION_RE = re.compile(
+        r'(?P<meeting_request>meeting|schedule|calendar|appointment)'
+        r'|(?P<report_generation>report|summary|overview)'
+        r'|(?P<data_analysis>analyze|analysis|data|metrics)'
+        r'|(?P<document_creation>document|create|write|draft)'
+        r'|(?P<follow_up>follow[- ]up|remind)',
+        re.IGNORECASE
+    )
+    @staticmethod
+    def _best_category_match(pattern: "re.Pattern", text: str) -> Optional["re.Match"]:
+        """
+        Match by category priority (group order), not keyword position.
+
+        "Please create the quarterly report" must classify as
+        report_generation even though "create" appears first, so among
+        all keyword hits the one from the earliest-declared group wins.
+        """
+        return min(pattern.finditer(text),
+                   key=lambda m: m.lastindex, default=None)
+
+    _URGENT_RE = re.compile(r'\b(urgent|asap|immediate|today|now)\b', re.IGNORECASE)
+    _VIP_RE = re.compile(r'\b(boss|manager|ceo|cto|director)\b', re.IGNORECASE)
+
+    # Authenticated services shared across watcher instances, keyed by
+    # credential pair - short-lived watchers skip refresh + build()
+    _service_cache: Dict[tuple, Any] = {}
+
     def __init__(self, config_path: str = "./config.yaml"):
         self.config_path = config_path
         self.config = {}
@@ -49,9 +108,16 @@ class GmailWatcher:
         # State
         self._running = False
         self._poll_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._write_queue: Optional[asyncio.Queue] = None
         self._credentials: Optional[Any] = None
         self._service: Optional[Any] = None
-        self._processed_email_ids: set = set()
+        self._users: Optional[Any] = None
+        # LRU-ordered dedup window, bounded so long-running watchers
+        # don't grow one entry per email ever seen
+        self._processed_email_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._processed_cap = 10_000
+        self._last_history_id: Optional[str] = None
         
         # Metrics
         self._emails_processed = 0
@@ -61,28 +127,26 @@ class GmailWatcher:
         
         # Load configuration
         self._load_config()
-        
+
+        # Restore dedup cursor/state persisted by a previous run
+        self._state_path = Path(self.vault_path) / "state" / "gmail_watcher.json"
+        self._load_state()
+
         self.logger.info("GmailWatcher initialized")
     
     def _load_config(self):
         """Load configuration."""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-            
-            # Load credentials from environment or config
-            self.client_id = (
-                os.getenv(ENV_GMAIL_CLIENT_ID) or 
-                self.config.get('gmail', {}).get('client_id')
-            )
-            self.client_secret = (
-                os.getenv(ENV_GMAIL_CLIENT_SECRET) or 
-                self.config.get('gmail', {}).get('client_secret')
-            )
-            self.refresh_token = (
-                os.getenv(ENV_GMAIL_REFRESH_TOKEN) or 
-                self.config.get('gmail', {}).get('refresh_token')
+            self.config = _load_config_cached(
+                self.config_path, os.stat(self.config_path).st_mtime_ns
             )
+
+            # Load credentials from environment or config
+            env_client_id, env_client_secret, env_refresh_token = _gmail_env_credentials()
+            gmail_config = self.config.get('gmail', {})
+            self.client_id = env_client_id or gmail_config.get('client_id')
+            self.client_secret = env_client_secret or gmail_config.get('client_secret')
+            self.refresh_token = env_refresh_token or gmail_config.get('refresh_token')
             
             self.vault_path = self.config.get('app', {}).get('vault_path', './AI_Employee_Vault')
             self.poll_interval = self.config.get('watcher', {}).get('poll_interval', 60)
@@ -94,7 +158,47 @@ class GmailWatcher:
         except Exception as e:
             self.logger.warning(f"Could not load config: {e}")
             self.vault_path = './AI_Employee_Vault'
-    
+
+    def _load_state(self):
+        """Restore the history cursor and dedup window from disk."""
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+
+            self._last_history_id = state.get('last_history_id')
+            for email_id in state.get('recent_ids', [])[-self._processed_cap:]:
+                self._processed_email_ids[email_id] = None
+
+            self.logger.debug("GmailWatcher state restored from previous run")
+        except (OSError, ValueError):
+            pass
+
+    def _save_state(self):
+        """Persist the history cursor and dedup window atomically."""
+        try:
+            ensure_directory_exists(str(self._state_path.parent))
+            state = {
+                'last_history_id': self._last_history_id,
+                'recent_ids': list(self._processed_email_ids)
+            }
+            # Create the temp file with its final mode in the open call
+            # (no chmod window), fsync, then rename into place
+            temp_path = self._state_path.with_suffix('.json.tmp')
+            payload = json.dumps(state).encode('utf-8')
+            fd = os.open(
+                str(temp_path),
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0),
+                0o600
+            )
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_path, self._state_path)
+        except OSError as e:
+            self.logger.warning(f"Could not persist watcher state: {e}")
+
     async def start(self):
         """Start the Gmail watcher."""
         if self._running:
@@ -112,7 +216,11 @@ class GmailWatcher:
         try:
             # Authenticate
             await self._authenticate()
-            
+
+            # Start background action-file writer
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
             # Start polling task
             self._poll_task = asyncio.create_task(self._poll_loop())
             
@@ -142,7 +250,17 @@ class GmailWatcher:
                 await self._poll_task
             except asyncio.CancelledError:
                 pass
-        
+
+        if self._writer_task:
+            # Let queued action files land on disk before shutting down
+            if self._write_queue is not None:
+                await self._write_queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+
         self.logger.info("GmailWatcher stopped")
         
         publish_event(
@@ -176,6 +294,13 @@ class GmailWatcher:
     
     async def _authenticate(self):
         """Authenticate with Gmail API using OAuth2."""
+        cache_key = (self.client_id, self.refresh_token)
+        cached = self._service_cache.get(cache_key)
+        if cached is not None:
+            self._service, self._users = cached
+            self.logger.debug("Reusing authenticated Gmail service")
+            return
+
         try:
             from google.oauth2.credentials import Credentials
             from google_auth_oauthlib.flow import InstalledAppFlow
@@ -199,9 +324,18 @@ class GmailWatcher:
             if self._credentials.expired or not self._credentials.valid:
                 self._credentials.refresh(Request())
             
-            # Build Gmail service
-            self._service = build('gmail', 'v1', credentials=self._credentials)
-            
+            # Build Gmail service from the bundled static discovery doc
+            # (no network fetch of the discovery JSON at startup); the
+            # users() collection is built once instead of per API call
+            self._service = build(
+                'gmail', 'v1',
+                credentials=self._credentials,
+                cache_discovery=False,
+                static_discovery=True
+            )
+            self._users = self._service.users()
+            self._service_cache[cache_key] = (self._service, self._users)
+
             self.logger.info("Gmail authentication successful")
             
         except ImportError:
@@ -213,104 +347,237 @@ class GmailWatcher:
     
     async def _poll_loop(self):
         """Main polling loop."""
+        idle_polls = 0
         while self._running:
             try:
-                await self._poll_inbox()
+                found = await self._poll_inbox()
                 self._last_poll = get_current_iso_timestamp()
+                self._save_state()
+                idle_polls = 0 if found else idle_polls + 1
             except Exception as e:
                 self._errors += 1
                 self.logger.error(f"Poll error: {e}")
-            
-            await asyncio.sleep(self.poll_interval)
-    
-    async def _poll_inbox(self):
-        """Poll Gmail inbox for new emails."""
+
+            # Quiet inboxes back off gradually (up to 4x the base
+            # interval); any new email resets to the fast cadence
+            delay = min(self.poll_interval * (1 + idle_polls // 3),
+                        self.poll_interval * 4)
+            await asyncio.sleep(delay)
+
+    async def _poll_inbox(self) -> int:
+        """Poll Gmail inbox for new emails. Returns the number found."""
         if not self._service:
-            return
-        
+            return 0
+
         try:
-            # Fetch unread emails
-            results = self._service.users().messages().list(
-                userId='me',
-                q='is:unread',
-                maxResults=10
-            ).execute()
-            
-            messages = results.get('messages', [])
-            
-            if not messages:
+            # Every blocking googleapiclient call runs in a thread so the
+            # event loop keeps servicing other tasks during network I/O
+            if self._last_history_id:
+                try:
+                    message_ids = await asyncio.to_thread(self._list_history_message_ids)
+                except Exception as e:
+                    # History window expired (404) or invalid - resync
+                    self.logger.debug(f"History sync failed, falling back to full list: {e}")
+                    self._last_history_id = None
+                    message_ids = await asyncio.to_thread(self._list_unread_message_ids)
+            else:
+                # First run: seed the history cursor, then do one full list
+                profile = await asyncio.to_thread(
+                    self._users.getProfile(userId='me').execute,
+                    num_retries=3
+                )
+                self._last_history_id = profile.get('historyId')
+                message_ids = await asyncio.to_thread(self._list_unread_message_ids)
+
+            if not message_ids:
                 self.logger.debug("No new emails")
-                return
-            
-            self.logger.info(f"Found {len(messages)} new emails")
-            
-            for msg in messages:
-                await self._process_email(msg['id'])
-            
+                return 0
+
+            self.logger.info(f"Found {len(message_ids)} new emails")
+
+            await self._process_emails_batch(message_ids)
+            return len(message_ids)
+
         except Exception as e:
             self._errors += 1
             raise GmailWatcherError(f"Poll failed: {e}")
+
+    def _list_unread_message_ids(self) -> List[str]:
+        """Full listing of unread message ids (first run / resync)."""
+        results = self._users.messages().list(
+            userId='me',
+            q='is:unread',
+            maxResults=10
+        ).execute(num_retries=3)
+
+        return [msg['id'] for msg in results.get('messages', [])]
+
+    def _list_history_message_ids(self) -> List[str]:
+        """Incremental listing of message ids added since the last poll."""
+        message_ids: List[str] = []
+        page_token = None
+
+        while True:
+            result = self._users.history().list(
+                userId='me',
+                startHistoryId=self._last_history_id,
+                historyTypes=['messageAdded'],
+                # Match the full-listing query (is:unread): without this
+                # filter the delta includes sent mail, drafts and spam
+                labelId='UNREAD',
+                pageToken=page_token
+            ).execute(num_retries=3)
+
+            for record in result.get('history', []):
+                for added in record.get('messagesAdded', []):
+                    message_ids.append(added['message']['id'])
+
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                # Advance the cursor only once the full delta is consumed
+                self._last_history_id = result.get('historyId', self._last_history_id)
+                break
+
+        return message_ids
     
-    async def _process_email(self, email_id: str):
+    async def _process_emails_batch(self, message_ids: List[str]):
         """
-        Process a single email.
-        
+        Fetch and process a batch of emails.
+
+        All messages().get calls go out in a single multipart HTTP
+        request instead of one round trip per email.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+        """
+        # Filter already-processed ids up front
+        new_ids = []
+        for email_id in message_ids:
+            if email_id in self._processed_email_ids:
+                self._processed_email_ids.move_to_end(email_id)
+            else:
+                new_ids.append(email_id)
+
+        if not new_ids:
+            return
+
+        responses: Dict[str, Any] = {}
+
+        def _on_message_loaded(request_id, response, exception):
+            if exception is not None:
+                self._errors += 1
+                self.logger.error(f"Error fetching email {request_id}: {exception}")
+            else:
+                responses[request_id] = response
+
+        # Metadata-only fetch: headers + snippet are enough to classify
+        # most emails, at a fraction of the bytes of format='full'.
+        # Gmail caps a batch request at 100 calls, so large backlogs
+        # are split into consecutive batches.
+        for start in range(0, len(new_ids), 100):
+            batch = self._service.new_batch_http_request()
+            for email_id in new_ids[start:start + 100]:
+                batch.add(
+                    self._users.messages().get(
+                        userId='me',
+                        id=email_id,
+                        format='metadata',
+                        metadataHeaders=['Subject', 'From', 'To', 'Date']
+                    ),
+                    request_id=email_id,
+                    callback=_on_message_loaded
+                )
+
+            await asyncio.to_thread(batch.execute)
+
+        # Process fetched emails concurrently: each may do a follow-up
+        # full fetch and a queue handoff, both of which overlap well
+        fetched = [(eid, responses[eid]) for eid in new_ids if eid in responses]
+        results = await asyncio.gather(
+            *(self._process_email(eid, msg) for eid, msg in fetched)
+        )
+        processed_ids = [eid for (eid, _), ok in zip(fetched, results) if ok]
+
+        # One batchModify marks the whole poll's emails read, instead of
+        # a modify round trip per message
+        if processed_ids:
+            await self._mark_emails_read(processed_ids)
+
+    async def _process_email(self, email_id: str, message: Dict[str, Any]):
+        """
+        Process a single fetched email.
+
         Args:
             email_id: Gmail message ID
+            message: Full message resource from the API
+
+        Returns:
+            True if an action file was created
         """
         try:
-            # Skip if already processed
-            if email_id in self._processed_email_ids:
-                return
-            
-            # Fetch email details
-            message = self._service.users().messages().get(
-                userId='me',
-                id=email_id,
-                format='full'
-            ).execute()
-            
             # Extract email data
             email_data = self._extract_email_data(message)
-            
+
+            # Metadata fetches carry no body; fall back to the full
+            # message only when the cheap subject+snippet scan is
+            # inconclusive, otherwise use the snippet as the preview
+            if not email_data['body']:
+                probe = f"{email_data['subject']} {email_data['snippet']}"
+                if self._ACTION_RE.search(probe) is None and len(email_data['snippet']) < 100:
+                    # Project away raw MIME, sizeEstimate etc. - only the
+                    # fields the extractor reads come over the wire
+                    message = await asyncio.to_thread(
+                        self._users.messages().get(
+                            userId='me',
+                            id=email_id,
+                            format='full',
+                            fields='id,threadId,snippet,labelIds,'
+                                   'payload(headers,body/data,parts)'
+                        ).execute,
+                        num_retries=3
+                    )
+                    email_data = self._extract_email_data(message)
+                else:
+                    email_data['body'] = email_data['snippet']
+
             # Create action file from email
             action = self._create_action_from_email(email_data)
-            
-            # Save action file
-            action_path = self._save_action_file(action)
-            
-            # Mark email as read
-            self._mark_email_read(email_id)
-            
+
+            # Save action file; ACTION_GENERATED is published once the
+            # file is actually on disk, so consumers can trust the path
+            await self._save_action_file(action, event_payload={
+                "action_id": action.id,
+                "action_type": action.type,
+                "source": "gmail",
+                "email_id": email_id
+            })
+
             # Update metrics
             self._emails_processed += 1
             self._actions_created += 1
-            self._processed_email_ids.add(email_id)
+            self._processed_email_ids[email_id] = None
+            while len(self._processed_email_ids) > self._processed_cap:
+                self._processed_email_ids.popitem(last=False)
             
             self.logger.info(f"Email processed: {email_data['subject'][:50]}...")
-            
-            # Publish action generated event
-            publish_event(
-                EventType.ACTION_GENERATED,
-                {
-                    "action_id": action.id,
-                    "action_type": action.type,
-                    "action_path": str(action_path),
-                    "source": "gmail",
-                    "email_id": email_id
-                },
-                source="gmail_watcher"
-            )
-            
+
+            return True
+
         except Exception as e:
             self._errors += 1
             self.logger.error(f"Error processing email {email_id}: {e}")
+            return False
     
+    # The only headers the pipeline reads; full fetches can carry
+    # dozens more (Received, DKIM, ARC...) that we never look at
+    _WANTED_HEADERS = frozenset(('Subject', 'From', 'To', 'Date'))
+
     def _extract_email_data(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant data from Gmail message."""
         headers = {
-            h['name']: h['value'] 
+            h['name']: h['value']
             for h in message['payload'].get('headers', [])
+            if h['name'] in self._WANTED_HEADERS
         }
         
         body = self._extract_email_body(message)
@@ -327,31 +594,90 @@ class GmailWatcher:
             'body': body
         }
     
-    def _extract_email_body(self, message: Dict[str, Any]) -> str:
-        """Extract body content from Gmail message."""
-        body = ""
-        
+    def _extract_email_body(self, message: Dict[str, Any], max_chars: int = 500) -> str:
+        """
+        Extract body content from Gmail message.
+
+        Only the preview window is decoded: the base64 payload is
+        truncated before decoding, so a multi-MB HTML email costs the
+        same as a short one. text/plain parts are preferred; text/html
+        is used only when no plain part exists.
+        """
+        payload = message['payload']
+        data = None
+
         # Check for direct body
-        if 'body' in message['payload']:
-            if 'data' in message['payload']['body']:
-                data = message['payload']['body']['data']
-                body = base64.urlsafe_b64decode(data).decode('utf-8')
-        else:
-            # Check parts
-            if 'parts' in message['payload']:
-                for part in message['payload']['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        if 'data' in part['body']:
-                            data = part['body']['data']
-                            body = base64.urlsafe_b64decode(data).decode('utf-8')
-                            break
-        
-        return body
+        if 'body' in payload:
+            data = payload['body'].get('data')
+
+        if data is None and 'parts' in payload:
+            # Iterative walk: multipart/alternative inside multipart/mixed
+            # nests parts arbitrarily deep, and recursion per level would
+            # cost a Python frame per container part
+            html_data = None
+            stack = payload['parts'][::-1]
+            while stack:
+                part = stack.pop()
+                nested = part.get('parts')
+                if nested:
+                    stack.extend(nested[::-1])
+                    continue
+                part_data = part.get('body', {}).get('data')
+                if not part_data:
+                    continue
+                if part['mimeType'] == 'text/plain':
+                    data = part_data
+                    break
+                if part['mimeType'] == 'text/html' and html_data is None:
+                    html_data = part_data
+            if data is None:
+                data = html_data
+
+        if not data:
+            return ""
+
+        # ~4 base64 chars per 3 output bytes; re-pad the truncated chunk
+        chunk = data[:(max_chars * 4) // 3 + 4]
+        chunk += '=' * (-len(chunk) % 4)
+        try:
+            raw = base64.urlsafe_b64decode(chunk)
+        except ValueError:
+            return ""
+
+        return raw.decode('utf-8', errors='replace')[:max_chars]
     
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _classify(subject: str, sender: str, body_prefix: str) -> tuple:
+        """
+        Classify an email into (action_type, priority).
+
+        Pure function of its inputs, memoized because automated senders
+        (ticketing, CI, monitoring) repeat near-identical subjects; the
+        body is capped at a prefix to bound cache-key size.
+        """
+        # Subjects are short and usually decisive; scan the body prefix
+        # only when the subject alone doesn't classify (also avoids
+        # allocating a concatenated haystack per email)
+        match = GmailWatcher._best_category_match(GmailWatcher._ACTION_RE, subject)
+        if match is None and body_prefix:
+            match = GmailWatcher._best_category_match(GmailWatcher._ACTION_RE, body_prefix)
+        action_type = match.lastgroup if match else 'email_response'
+
+        if GmailWatcher._URGENT_RE.search(subject) or GmailWatcher._VIP_RE.search(sender):
+            priority = 'high'
+        else:
+            priority = 'medium'
+
+        return action_type, priority
+
     def _create_action_from_email(self, email_data: Dict[str, Any]) -> ActionFile:
         """Create action file from email data."""
-        action_type = self._determine_action_type(email_data)
-        priority = self._determine_priority(email_data)
+        action_type, priority = self._classify(
+            email_data.get('subject', ''),
+            email_data.get('from', ''),
+            email_data.get('body', '')[:500]
+        )
         
         context = {
             'sender': email_data['from'],
@@ -373,60 +699,115 @@ class GmailWatcher:
     
     def _determine_action_type(self, email_data: Dict[str, Any]) -> str:
         """Determine action type from email content."""
-        subject = email_data.get('subject', '').lower()
-        body = email_data.get('body', '').lower()
-        content = f"{subject} {body}"
-        
-        if any(kw in content for kw in ['meeting', 'schedule', 'calendar', 'appointment']):
-            return 'meeting_request'
-        elif any(kw in content for kw in ['report', 'summary', 'overview']):
-            return 'report_generation'
-        elif any(kw in content for kw in ['analyze', 'analysis', 'data', 'metrics']):
-            return 'data_analysis'
-        elif any(kw in content for kw in ['document', 'create', 'write', 'draft']):
-            return 'document_creation'
-        elif any(kw in content for kw in ['follow up', 'follow-up', 'remind']):
-            return 'follow_up'
-        else:
-            return 'email_response'
-    
+        action_type, _ = self._classify(
+            email_data.get('subject', ''),
+            email_data.get('from', ''),
+            email_data.get('body', '')[:500]
+        )
+        return action_type
+
     def _determine_priority(self, email_data: Dict[str, Any]) -> str:
         """Determine priority from email."""
-        subject = email_data.get('subject', '').lower()
-        sender = email_data.get('from', '').lower()
-        
-        # Urgent keywords
-        if any(kw in subject for kw in ['urgent', 'asap', 'immediate', 'today', 'now']):
-            return 'high'
-        
-        # VIP sender indicators
-        if any(vip in sender for vip in ['boss', 'manager', 'ceo', 'cto', 'director']):
-            return 'high'
-        
-        return 'medium'
+        _, priority = self._classify(
+            email_data.get('subject', ''),
+            email_data.get('from', ''),
+            email_data.get('body', '')[:500]
+        )
+        return priority
     
-    def _save_action_file(self, action: ActionFile) -> Path:
-        """Save action file to Needs_Action folder."""
+    async def _save_action_file(
+        self,
+        action: ActionFile,
+        event_payload: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Queue an action file for the background writer.
+
+        When event_payload is given, ACTION_GENERATED is published with
+        it only after the file exists at action_path - from the writer
+        for queued saves, inline otherwise - never before.
+        """
         needs_action_path = Path(self.vault_path) / "Needs_Action"
         ensure_directory_exists(str(needs_action_path))
-        
+
         action_filename = f"{action.id}.action.yaml"
         action_path = needs_action_path / action_filename
-        
-        action.save_to_file(str(action_path))
-        
+        if event_payload is not None:
+            event_payload["action_path"] = str(action_path)
+
+        if self._write_queue is not None:
+            await self._write_queue.put((action, action_path, event_payload))
+        else:
+            # Writer not running (e.g. direct use in tests) - write inline
+            action.save_to_file(str(action_path))
+            if event_payload is not None:
+                publish_event(
+                    EventType.ACTION_GENERATED,
+                    event_payload,
+                    source="gmail_watcher"
+                )
+
         return action_path
+
+    async def _writer_loop(self):
+        """
+        Drain queued action files in batches.
+
+        Decouples Gmail API latency from disk latency: writes happen on
+        a worker thread and the directory is fsynced once per batch
+        instead of once per file.
+        """
+        while True:
+            batch = [await self._write_queue.get()]
+
+            # Opportunistically collect a burst, up to 32 items
+            while len(batch) < 32:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._write_queue.get(), timeout=0.05)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            for action, action_path, event_payload in batch:
+                try:
+                    await asyncio.to_thread(action.save_to_file, str(action_path))
+                except Exception as e:
+                    self._errors += 1
+                    self.logger.error(f"Failed to write action file {action_path}: {e}")
+                else:
+                    # The file is on disk - now the advertised path holds
+                    if event_payload is not None:
+                        publish_event(
+                            EventType.ACTION_GENERATED,
+                            event_payload,
+                            source="gmail_watcher"
+                        )
+                finally:
+                    self._write_queue.task_done()
+
+            # One directory fsync per batch makes the new entries durable
+            try:
+                dir_fd = os.open(str(batch[0][1].parent), os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
     
-    def _mark_email_read(self, email_id: str):
-        """Mark email as read in Gmail."""
+    async def _mark_emails_read(self, email_ids: List[str]):
+        """Mark a batch of emails as read in Gmail with one call."""
         try:
-            self._service.users().messages().modify(
-                userId='me',
-                id=email_id,
-                body={'removeLabelIds': ['UNREAD']}
-            ).execute()
+            await asyncio.to_thread(
+                self._users.messages().batchModify(
+                    userId='me',
+                    body={'ids': email_ids, 'removeLabelIds': ['UNREAD']}
+                ).execute,
+                num_retries=3
+            )
         except Exception as e:
-            self.logger.error(f"Failed to mark email as read: {e}")
+            self.logger.error(f"Failed to mark emails as read: {e}")
 
 
 # Factory function
@@ -3,6 +3,7 @@ Health Check Service - Gold Tier
 Comprehensive health checking with endpoints for all services
 """
 import asyncio
+import threading
 import time
 import logging
 import psutil
@@ -20,6 +21,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.utils import get_current_iso_timestamp
 from lib.event_bus import get_event_bus, EventType, publish_event
 
+# Optional dependency: only API checkers need it, so deployments
+# without external API probes can run without aiohttp installed
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds elapsed since a time.perf_counter() sample."""
+    return (time.perf_counter() - start) * 1000.0
+
 
 class HealthStatus(Enum):
     """Health status levels."""
@@ -29,7 +42,17 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Severity ranking used to reduce per-check results to an overall status
+_STATUS_PRIORITY = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNHEALTHY: 2,
+    HealthStatus.UNKNOWN: 3
+}
+_STATUS_BY_PRIORITY = {v: k for k, v in _STATUS_PRIORITY.items()}
+
+
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
     name: str
@@ -50,7 +73,7 @@ class HealthCheckResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealth:
     """Overall system health status."""
     status: HealthStatus
@@ -58,26 +81,37 @@ class SystemHealth:
     checks: Dict[str, HealthCheckResult]
     uptime_seconds: float
     version: str = "1.0.0"
-    
+    # Snapshots are immutable once built, so the serialized form is
+    # computed once and shared by the event bus and every endpoint
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, compare=False, repr=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "status": self.status.value,
-            "timestamp": self.timestamp,
-            "checks": {k: v.to_dict() for k, v in self.checks.items()},
-            "uptime_seconds": self.uptime_seconds,
-            "version": self.version
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "status": self.status.value,
+                "timestamp": self.timestamp,
+                "checks": {k: v.to_dict() for k, v in self.checks.items()},
+                "uptime_seconds": self.uptime_seconds,
+                "version": self.version
+            }
+        return self._cached_dict
 
 
 class HealthChecker:
     """
     Base class for health checkers.
     """
-    
+
+    # Deadline applied around check(); a hung checker fails with a
+    # timeout instead of stalling the whole aggregation
+    timeout: float = 5.0
+
     def __init__(self, name: str):
         self.name = name
         self.logger = logging.getLogger(f"HealthChecker.{name}")
-    
+
     async def check(self) -> HealthCheckResult:
         """Perform health check. Override in subclass."""
         raise NotImplementedError
@@ -92,7 +126,7 @@ class ServiceHealthChecker(HealthChecker):
     
     async def check(self) -> HealthCheckResult:
         """Check service health."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check if service has health_check method
@@ -103,7 +137,7 @@ class ServiceHealthChecker(HealthChecker):
                 else:
                     is_healthy = health_check()
                 
-                latency_ms = (time.time() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 
                 if is_healthy:
                     # Get metrics if available
@@ -134,54 +168,90 @@ class ServiceHealthChecker(HealthChecker):
                     name=self.name,
                     status=HealthStatus.UNKNOWN,
                     message="No health check method available",
-                    latency_ms=(time.time() - start_time) * 1000
+                    latency_ms=_elapsed_ms(start_time)
                 )
         except Exception as e:
             return HealthCheckResult(
                 name=self.name,
                 status=HealthStatus.UNHEALTHY,
                 message=f"Health check error: {str(e)}",
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=_elapsed_ms(start_time)
             )
 
 
 class DatabaseHealthChecker(HealthChecker):
     """Health checker for database/file system."""
-    
+
+    # Disk usage changes slowly relative to the probe cadence; one
+    # statvfs per path per minute is plenty, shared across checkers
+    _disk_cache: Dict[str, tuple] = {}
+    _disk_cache_lock = threading.Lock()
+    _DISK_CACHE_TTL = 60.0
+
     def __init__(self, name: str, path: str):
         super().__init__(name)
         self.path = Path(path)
-    
+        self._probe_count = 0
+
+    def _probe_write(self):
+        """Synchronous write probe, run on a worker thread."""
+        test_file = self.path / ".health_check"
+        test_file.write_text(get_current_iso_timestamp())
+        test_file.unlink()
+
+    async def _disk_usage(self):
+        """Disk usage for this checker's path, cached for a minute."""
+        key = str(self.path)
+        now = time.monotonic()
+        with self._disk_cache_lock:
+            cached = self._disk_cache.get(key)
+            if cached and (now - cached[0]) < self._DISK_CACHE_TTL:
+                return cached[1]
+
+        usage = await asyncio.to_thread(psutil.disk_usage, key)
+        with self._disk_cache_lock:
+            self._disk_cache[key] = (now, usage)
+        return usage
+
     async def check(self) -> HealthCheckResult:
         """Check database/file system health."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Check if path exists and is writable
-            if not self.path.exists():
+            # Check if path exists and is writable; both touch the
+            # filesystem, so they run off the event loop
+            if not await asyncio.to_thread(self.path.exists):
                 return HealthCheckResult(
                     name=self.name,
                     status=HealthStatus.UNHEALTHY,
                     message=f"Path does not exist: {self.path}",
-                    latency_ms=(time.time() - start_time) * 1000
+                    latency_ms=_elapsed_ms(start_time)
                 )
-            
-            # Check write access
-            test_file = self.path / ".health_check"
-            try:
-                test_file.write_text(get_current_iso_timestamp())
-                test_file.unlink()
-            except Exception as e:
+
+            # Check write access - a real write/delete round trip every
+            # 5th probe, a cheap os.access permission test in between
+            if self._probe_count % 5 == 0:
+                try:
+                    await asyncio.to_thread(self._probe_write)
+                except Exception as e:
+                    return HealthCheckResult(
+                        name=self.name,
+                        status=HealthStatus.UNHEALTHY,
+                        message=f"Write access failed: {str(e)}",
+                        latency_ms=_elapsed_ms(start_time)
+                    )
+            elif not await asyncio.to_thread(os.access, str(self.path), os.W_OK):
                 return HealthCheckResult(
                     name=self.name,
                     status=HealthStatus.UNHEALTHY,
-                    message=f"Write access failed: {str(e)}",
-                    latency_ms=(time.time() - start_time) * 1000
+                    message=f"Path not writable: {self.path}",
+                    latency_ms=_elapsed_ms(start_time)
                 )
-            
+            self._probe_count += 1
+
             # Check disk space
             try:
-                usage = psutil.disk_usage(str(self.path))
+                usage = await self._disk_usage()
                 disk_free_gb = usage.free / (1024 ** 3)
                 
                 if disk_free_gb < 1:
@@ -195,7 +265,7 @@ class DatabaseHealthChecker(HealthChecker):
                     name=self.name,
                     status=status,
                     message=message,
-                    latency_ms=(time.time() - start_time) * 1000,
+                    latency_ms=_elapsed_ms(start_time),
                     details={
                         "disk_free_gb": disk_free_gb,
                         "disk_total_gb": usage.total / (1024 ** 3),
@@ -207,7 +277,7 @@ class DatabaseHealthChecker(HealthChecker):
                     name=self.name,
                     status=HealthStatus.DEGRADED,
                     message=f"Could not check disk space: {str(e)}",
-                    latency_ms=(time.time() - start_time) * 1000
+                    latency_ms=_elapsed_ms(start_time)
                 )
                 
         except Exception as e:
@@ -215,29 +285,47 @@ class DatabaseHealthChecker(HealthChecker):
                 name=self.name,
                 status=HealthStatus.UNHEALTHY,
                 message=f"Health check error: {str(e)}",
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=_elapsed_ms(start_time)
             )
 
 
 class APIHealthChecker(HealthChecker):
     """Health checker for external APIs."""
-    
-    def __init__(self, name: str, url: str, timeout: float = 5.0):
+
+    def __init__(self, name: str, url: str, timeout: float = 5.0, session_factory: Optional[Callable] = None):
         super().__init__(name)
         self.url = url
         self.timeout = timeout
-    
+        # Async callable returning a shared ClientSession; probes reuse
+        # its pooled connections instead of a TLS handshake per check
+        self._session_factory = session_factory
+
     async def check(self) -> HealthCheckResult:
         """Check API health."""
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
+        if aiohttp is None:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.UNKNOWN,
+                message="aiohttp not installed; API check skipped"
+            )
+
         try:
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.url, timeout=self.timeout) as response:
-                    latency_ms = (time.time() - start_time) * 1000
-                    
+            if self._session_factory is not None:
+                session = await self._session_factory()
+                owns_session = False
+            else:
+                # Standalone use without a service-owned pool
+                session = aiohttp.ClientSession()
+                owns_session = True
+
+            try:
+                async with session.get(
+                    self.url, timeout=aiohttp.ClientTimeout(total=self.timeout)
+                ) as response:
+                    latency_ms = _elapsed_ms(start_time)
+
                     if response.status == 200:
                         return HealthCheckResult(
                             name=self.name,
@@ -254,44 +342,59 @@ class APIHealthChecker(HealthChecker):
                             latency_ms=latency_ms,
                             details={"status_code": response.status}
                         )
+            finally:
+                if owns_session:
+                    await session.close()
         except asyncio.TimeoutError:
             return HealthCheckResult(
                 name=self.name,
                 status=HealthStatus.UNHEALTHY,
                 message=f"API request timed out after {self.timeout}s",
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=_elapsed_ms(start_time)
             )
         except Exception as e:
             return HealthCheckResult(
                 name=self.name,
                 status=HealthStatus.UNHEALTHY,
                 message=f"API health check failed: {str(e)}",
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=_elapsed_ms(start_time)
             )
 
 
 class SystemHealthChecker(HealthChecker):
     """Health checker for system resources."""
-    
+
+    timeout = 1.0  # local psutil sampling should never take long
+
     def __init__(self):
         super().__init__("system")
-    
+        # One Process handle for the checker's lifetime - constructing
+        # it re-parses /proc/<pid> metadata on every call otherwise
+        self._process = psutil.Process(os.getpid())
+        # Prime the delta-based CPU counters so interval=None sampling
+        # returns valid readings without a blocking sleep
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+
+    def _sample_system(self) -> tuple:
+        """Synchronous psutil sampling, run on a worker thread."""
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        process_memory = self._process.memory_info().rss / (1024 * 1024)  # MB
+        open_files = len(self._process.open_files())
+        threads = self._process.num_threads()
+        return cpu_percent, memory, process_memory, open_files, threads
+
     async def check(self) -> HealthCheckResult:
         """Check system resource health."""
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
+            cpu_percent, memory, process_memory, open_files, threads = (
+                await asyncio.to_thread(self._sample_system)
+            )
             memory_percent = memory.percent
-            
-            # Process info
-            process = psutil.Process(os.getpid())
-            process_memory = process.memory_info().rss / (1024 * 1024)  # MB
-            
+
             # Determine status
             if cpu_percent > 90 or memory_percent > 90:
                 status = HealthStatus.UNHEALTHY
@@ -304,14 +407,14 @@ class SystemHealthChecker(HealthChecker):
                 name="system",
                 status=status,
                 message=f"CPU: {cpu_percent}%, Memory: {memory_percent}%",
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=_elapsed_ms(start_time),
                 details={
                     "cpu_percent": cpu_percent,
                     "memory_percent": memory_percent,
                     "memory_available_mb": memory.available / (1024 * 1024),
                     "process_memory_mb": process_memory,
-                    "open_files": len(process.open_files()),
-                    "threads": process.num_threads()
+                    "open_files": open_files,
+                    "threads": threads
                 }
             )
         except Exception as e:
@@ -319,7 +422,7 @@ class SystemHealthChecker(HealthChecker):
                 name="system",
                 status=HealthStatus.UNHEALTHY,
                 message=f"System health check failed: {str(e)}",
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=_elapsed_ms(start_time)
             )
 
 
@@ -336,14 +439,26 @@ class HealthCheckService:
         # Registered checkers
         self._checkers: Dict[str, HealthChecker] = {}
         self._services: Dict[str, Any] = {}
+
+        # Shared HTTP session for API checkers (lazily created)
+        self._http_session: Optional[Any] = None
         
         # Health cache
         self._last_health: Optional[SystemHealth] = None
         self._cache_ttl = 10  # seconds
         self._cache_time = 0
+
+        # Background refresher keeps the snapshot warm so endpoints
+        # never wait on a checker
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Single-flight guard: concurrent cold-cache callers share one
+        # round of checks instead of each launching their own
+        self._inflight: Optional[asyncio.Task] = None
+        self._refresh_interval = 5.0  # seconds
         
-        # Start time for uptime
-        self._start_time = time.time()
+        # Start time for uptime (monotonic: immune to clock jumps)
+        self._start_time = time.monotonic()
         
         # Register default checkers
         self._register_default_checkers()
@@ -358,6 +473,35 @@ class HealthCheckService:
         # Vault/file system
         self._checkers["vault"] = DatabaseHealthChecker("vault", self.vault_path)
     
+    async def _get_http_session(self):
+        """Lazily create the pooled session shared by all API checkers."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                )
+            )
+        return self._http_session
+
+    def register_api(self, name: str, url: str, timeout: float = 5.0):
+        """Register an external API endpoint for health checking."""
+        if aiohttp is None:
+            self.logger.warning(f"aiohttp not installed; cannot register API check: {name}")
+            return
+        self._checkers[name] = APIHealthChecker(
+            name, url, timeout, session_factory=self._get_http_session
+        )
+        self.logger.info(f"Registered API for health checking: {name}")
+
+    async def close(self):
+        """Release the shared HTTP session."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+            self._http_session = None
+
     def register_service(self, name: str, service: Any):
         """Register a service for health checking."""
         self._services[name] = service
@@ -371,59 +515,115 @@ class HealthCheckService:
         if name in self._checkers:
             del self._checkers[name]
     
+    async def start(self):
+        """Start the background health refresher."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+            self.logger.info("Health check background refresher started")
+
+    async def stop(self):
+        """Stop the background refresher and release resources."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        await self.close()
+
+    async def _refresh_loop(self):
+        """Run all checks on an interval so reads are always instant."""
+        while True:
+            try:
+                await self._run_checks()
+            except Exception as e:
+                self.logger.error(f"Background health check failed: {e}")
+            await asyncio.sleep(self._refresh_interval)
+
     async def check_all(self, use_cache: bool = True) -> SystemHealth:
         """
         Perform health checks on all registered checkers.
-        
+
         Args:
             use_cache: Use cached result if not expired
-            
+
         Returns:
             System health status
         """
-        # Check cache
-        now = time.time()
-        if use_cache and self._last_health and (now - self._cache_time) < self._cache_ttl:
-            return self._last_health
-        
-        # Run all checks concurrently
+        # Check cache (monotonic so NTP jumps can't skew the TTL)
+        now = time.monotonic()
+        if use_cache and self._last_health:
+            age = now - self._cache_time
+            if self._refresh_task is not None and not self._refresh_task.done():
+                # Refresher owns the checks; serve the snapshot, but a
+                # stalled refresher makes the system report unhealthy
+                if age > 3 * self._refresh_interval:
+                    return SystemHealth(
+                        status=HealthStatus.UNHEALTHY,
+                        timestamp=self._last_health.timestamp,
+                        checks=self._last_health.checks,
+                        uptime_seconds=now - self._start_time
+                    )
+                return self._last_health
+            if age < self._cache_ttl:
+                return self._last_health
+
+        if self._inflight is not None:
+            return await self._inflight
+
+        self._inflight = asyncio.ensure_future(self._run_checks())
+        try:
+            return await self._inflight
+        finally:
+            self._inflight = None
+
+    async def _run_checks(self) -> SystemHealth:
+        """Execute every registered checker and rebuild the snapshot."""
+        now = time.monotonic()
+
+        # Run all checks concurrently, each bounded by its own deadline
+        # Immutable snapshot: un/register during the gather can't shift
+        # results onto the wrong checker
+        checkers = tuple(self._checkers.values())
         results = await asyncio.gather(
-            *[checker.check() for checker in self._checkers.values()],
+            *[asyncio.wait_for(checker.check(), timeout=checker.timeout)
+              for checker in checkers],
             return_exceptions=True
         )
-        
-        # Process results
+
+        # Process results, reducing to the worst severity seen
         checks: Dict[str, HealthCheckResult] = {}
-        worst_status = HealthStatus.HEALTHY
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                checker_name = list(self._checkers.keys())[i]
-                checks[checker_name] = HealthCheckResult(
-                    name=checker_name,
+        worst_rank = 0
+
+        for checker, result in zip(checkers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning(
+                    f"Health check timed out: {checker.name} ({checker.timeout}s)"
+                )
+                checks[checker.name] = HealthCheckResult(
+                    name=checker.name,
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Health check timed out after {checker.timeout}s"
+                )
+                worst_rank = max(worst_rank, _STATUS_PRIORITY[HealthStatus.UNHEALTHY])
+            elif isinstance(result, Exception):
+                checks[checker.name] = HealthCheckResult(
+                    name=checker.name,
                     status=HealthStatus.UNHEALTHY,
                     message=f"Health check exception: {str(result)}"
                 )
-                worst_status = HealthStatus.UNHEALTHY
+                worst_rank = max(worst_rank, _STATUS_PRIORITY[HealthStatus.UNHEALTHY])
             elif isinstance(result, HealthCheckResult):
                 checks[result.name] = result
-                
-                # Track worst status
-                status_priority = {
-                    HealthStatus.HEALTHY: 0,
-                    HealthStatus.DEGRADED: 1,
-                    HealthStatus.UNHEALTHY: 2,
-                    HealthStatus.UNKNOWN: 3
-                }
-                if status_priority.get(result.status, 3) > status_priority.get(worst_status, 0):
-                    worst_status = result.status
-        
+                worst_rank = max(worst_rank, _STATUS_PRIORITY.get(result.status, 3))
+
         # Build system health
         system_health = SystemHealth(
-            status=worst_status,
+            status=_STATUS_BY_PRIORITY[worst_rank],
             timestamp=get_current_iso_timestamp(),
             checks=checks,
-            uptime_seconds=time.time() - self._start_time
+            uptime_seconds=time.monotonic() - self._start_time
         )
         
         # Update cache
@@ -439,6 +639,44 @@ class HealthCheckService:
         
         return system_health
     
+    def get_snapshot(self) -> Optional[SystemHealth]:
+        """Latest background snapshot, or None when not refreshed."""
+        if self._refresh_task is None or self._refresh_task.done():
+            return None
+        if self._last_health is None:
+            return None
+        if (time.monotonic() - self._cache_time) > 3 * self._refresh_interval:
+            return None
+        return self._last_health
+
+    async def check_subset(self, names):
+        """
+        Run only the named checkers, yielding results as they finish.
+
+        Lets callers short-circuit on the first failure instead of
+        waiting for the slowest checker in the full set.
+        """
+        checkers = [self._checkers[n] for n in names if n in self._checkers]
+
+        async def _run(checker):
+            try:
+                return await asyncio.wait_for(checker.check(), timeout=checker.timeout)
+            except asyncio.TimeoutError:
+                return HealthCheckResult(
+                    name=checker.name,
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Health check timed out after {checker.timeout}s"
+                )
+            except Exception as e:
+                return HealthCheckResult(
+                    name=checker.name,
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Health check exception: {str(e)}"
+                )
+
+        for future in asyncio.as_completed([_run(c) for c in checkers]):
+            yield await future
+
     async def check_single(self, name: str) -> Optional[HealthCheckResult]:
         """Check health of a single component."""
         checker = self._checkers.get(name)
@@ -460,7 +698,7 @@ class HealthCheckService:
         return {
             "status": self._last_health.status.value if self._last_health else "unknown",
             "timestamp": get_current_iso_timestamp(),
-            "uptime_seconds": time.time() - self._start_time,
+            "uptime_seconds": time.monotonic() - self._start_time,
             "check_count": len(self._checkers),
             "services": list(self._services.keys())
         }
@@ -520,23 +758,39 @@ class HealthEndpoints:
         Readiness probe - is the service ready to accept requests?
         Returns healthy only if all critical components are healthy.
         """
-        health = await self.health_service.check_all(use_cache=False)
-        
-        # Check critical components
         critical_checks = ["system", "vault"]
-        for check_name in critical_checks:
-            check = health.checks.get(check_name)
-            if check and check.status == HealthStatus.UNHEALTHY:
+
+        # With a warm background snapshot, readiness is a dict lookup
+        health = self.health_service.get_snapshot()
+        if health is not None:
+            for check_name in critical_checks:
+                check = health.checks.get(check_name)
+                if check and check.status == HealthStatus.UNHEALTHY:
+                    return {
+                        "status": "unhealthy",
+                        "timestamp": health.timestamp,
+                        "failed_check": check_name,
+                        "message": check.message
+                    }
+            return {
+                "status": "healthy",
+                "timestamp": health.timestamp
+            }
+
+        # Cold path: probe only the critical checkers and return on
+        # the first failure instead of awaiting the full set
+        async for result in self.health_service.check_subset(critical_checks):
+            if result.status == HealthStatus.UNHEALTHY:
                 return {
                     "status": "unhealthy",
-                    "timestamp": health.timestamp,
-                    "failed_check": check_name,
-                    "message": check.message
+                    "timestamp": result.timestamp,
+                    "failed_check": result.name,
+                    "message": result.message
                 }
-        
+
         return {
             "status": "healthy",
-            "timestamp": health.timestamp
+            "timestamp": get_current_iso_timestamp()
         }
     
     async def handle_metrics(self) -> str:
@@ -2,27 +2,132 @@
 Logging Service - Gold Tier
 Centralized structured logging with log aggregation
 """
+import atexit
+import functools
 import logging
 import json
+import os
+import queue
+import threading
+import time
+from logging.handlers import (
+    MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+)
 from pathlib import Path
 from typing import Dict, Any, Optional
-from datetime import datetime
 import yaml
 import sys
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the src directory to the path (guarded so repeated imports under
+# reloaders don't grow sys.path)
+_src_dir = str(Path(__file__).parent.parent)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
 from lib.event_bus import EventType, get_event_bus, Event
 from lib.utils import get_current_iso_timestamp
 
+# orjson serializes in native code, several times faster than stdlib
+# json; fall back transparently when it is not installed
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# zstd compresses rotated logs at roughly gzip's ratio for half the
+# CPU; rotation falls back to plain renames when it is not installed
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config once per (path, mtime); reused across instances."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+# Attributes every LogRecord carries; anything else is a caller-supplied
+# extra field worth surfacing in the JSON output
+_STD_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'pathname', 'process', 'processName', 'relativeCreated',
+    'stack_info', 'exc_info', 'exc_text', 'thread', 'threadName',
+    'message', 'asctime', 'taskName'
+})
+
+
+# Shared service logger; getLogger is idempotent but still takes the
+# manager lock, so resolve it once at import time
+_LOGGER = logging.getLogger("LoggingService")
+
+
+# Second-precision UTC prefix cached across records: strftime runs once
+# per second, each record only appends its microseconds
+_last_sec = [0, ""]
+
+
+def _format_timestamp(created: float) -> str:
+    sec = int(created)
+    if sec != _last_sec[0]:
+        _last_sec[0] = sec
+        _last_sec[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+    return f"{_last_sec[1]}.{int((created - sec) * 1_000_000):06d}Z"
+
+
+class ZstdRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler whose rotated backups are zstd-compressed."""
+
+    def rotation_filename(self, default_name: str) -> str:
+        if _zstd is not None:
+            return default_name + ".zst"
+        return default_name
+
+    def rotate(self, source: str, dest: str) -> None:
+        if _zstd is None:
+            if os.path.exists(source):
+                os.replace(source, dest)
+            return
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            _zstd.ZstdCompressor(level=3).copy_stream(src, dst)
+        os.remove(source)
+
+
+class TextFormatter(logging.Formatter):
+    """Text formatter reusing the strftime result while seconds match.
+
+    Same idea as _format_timestamp, but keeps the default asctime
+    layout ("%Y-%m-%d %H:%M:%S,mmm") so text output is unchanged.
+    """
+
+    def __init__(self, fmt: Optional[str] = None):
+        super().__init__(fmt)
+        self._cached_sec = 0
+        self._cached_prefix = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_prefix = time.strftime(
+                "%Y-%m-%d %H:%M:%S", self.converter(sec)
+            )
+        return "%s,%03d" % (self._cached_prefix, record.msecs)
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
-    
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -37,13 +142,16 @@ class JSONFormatter(logging.Formatter):
         
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName', 
-                          'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                          'pathname', 'process', 'processName', 'relativeCreated',
-                          'stack_info', 'exc_info', 'exc_text', 'thread', 'threadName']:
+            if key not in _STD_RECORD_ATTRS:
                 log_data[key] = value
         
-        return json.dumps(log_data)
+        if _orjson is not None:
+            try:
+                return _orjson.dumps(log_data).decode('utf-8')
+            except TypeError:
+                # Extra fields may carry types orjson refuses (e.g. sets)
+                pass
+        return json.dumps(log_data, default=str)
 
 
 class LoggingService:
@@ -60,7 +168,7 @@ class LoggingService:
     def __init__(self, config_path: str = "./config.yaml"):
         self.config_path = config_path
         self.config = {}
-        self.logger = logging.getLogger("LoggingService")
+        self.logger = _LOGGER
         self.event_bus = get_event_bus()
         
         # Configuration
@@ -68,9 +176,18 @@ class LoggingService:
         self.log_format: str = "json"  # json or text
         self.log_file: Optional[str] = None
         self.log_dir: str = "./logs"
+        self.log_max_bytes: int = 0  # 0 disables rotation
+        self.log_backup_count: int = 5
         
         # Metrics
         self._events_logged = 0
+
+        # Queue front-end decoupling log calls from handler I/O
+        self._log_queue: Optional[queue.SimpleQueue] = None
+        self._log_listener: Optional[QueueListener] = None
+        self._file_buffer: Optional[MemoryHandler] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._atexit_registered = False
         
         # Load configuration
         self._load_config()
@@ -86,14 +203,18 @@ class LoggingService:
     def _load_config(self):
         """Load configuration."""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-            
+            self.config = _load_config_cached(
+                self.config_path, os.stat(self.config_path).st_mtime_ns
+            )
+
+
             logging_config = self.config.get('logging', {})
             self.log_level = logging_config.get('level', 'INFO')
             self.log_format = logging_config.get('format', 'json').split('%')[0]  # Simple check
             self.log_file = logging_config.get('file', './logs/app.log')
             self.log_dir = str(Path(self.log_file).parent) if self.log_file else './logs'
+            self.log_max_bytes = int(logging_config.get('max_bytes', 0))
+            self.log_backup_count = int(logging_config.get('backup_count', 5))
             
         except Exception as e:
             self.log_level = 'INFO'
@@ -104,6 +225,14 @@ class LoggingService:
         """Configure application logging."""
         # Ensure log directory exists
         Path(self.log_dir).mkdir(parents=True, exist_ok=True)
+
+        # Neither formatter emits thread/process/task fields, so skip
+        # the per-record introspection that populates them
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        if hasattr(logging, 'logAsyncioTasks'):
+            logging.logAsyncioTasks = False
         
         # Get root logger
         root_logger = logging.getLogger()
@@ -123,24 +252,59 @@ class LoggingService:
             console_handler.setFormatter(JSONFormatter())
         else:
             console_handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+                TextFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
             )
         
         handlers.append(console_handler)
         
-        # File handler
+        # File handler, buffered: records are held in memory and written
+        # in bursts instead of one write+flush syscall pair per record.
+        # ERROR-or-worse flushes immediately, and a timer bounds how long
+        # a quiet period can keep records buffered
         if self.log_file:
-            file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+            if self.log_max_bytes > 0:
+                file_handler = ZstdRotatingFileHandler(
+                    self.log_file,
+                    maxBytes=self.log_max_bytes,
+                    backupCount=self.log_backup_count,
+                    encoding='utf-8'
+                )
+            else:
+                file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(JSONFormatter())
-            handlers.append(file_handler)
-        
-        # Add handlers to root logger
-        for handler in handlers:
-            root_logger.addHandler(handler)
+            self._file_buffer = MemoryHandler(
+                capacity=self._FLUSH_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            handlers.append(self._file_buffer)
         
-        self.logger = logging.getLogger("LoggingService")
-        self.logger.info(f"Logging configured: level={self.log_level}, format={self.log_format}, file={self.log_file}")
+        # Producers only enqueue records; formatting and file/console
+        # writes happen on the listener's background thread, so a slow
+        # disk never stalls a logger.info() caller
+        self._log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
+        root_logger.addHandler(QueueHandler(self._log_queue))
+
+        # Drain queued records even if stop() is never called; records
+        # enqueued after interpreter teardown begins can still be lost.
+        # Registered once - rebuilds after a restart reuse the hook
+        if not self._atexit_registered:
+            atexit.register(self._shutdown_listener)
+            self._atexit_registered = True
+
+        if self._file_buffer is not None:
+            self._schedule_flush()
+
+        self.logger = _LOGGER
+        self.logger.info(
+            "Logging configured: level=%s, format=%s, file=%s",
+            self.log_level, self.log_format, self.log_file
+        )
     
     def _setup_event_handlers(self):
         """Setup event bus handlers for system events."""
@@ -154,20 +318,31 @@ class LoggingService:
         
         self.logger.info("LoggingService event handlers registered")
     
+    _WARNING_EVENTS = frozenset({EventType.SERVICE_ERROR, EventType.ACTION_FAILED})
+    _INFO_EVENTS = frozenset({EventType.SYSTEM_SHUTDOWN, EventType.SYSTEM_RESTART})
+
     def _on_event(self, event: Event):
         """Handle system events - log them."""
         self._events_logged += 1
-        
-        # Log based on event type
-        if event.event_type in [EventType.SERVICE_ERROR, EventType.ACTION_FAILED]:
-            self.logger.warning(f"Event: {event.event_type.value} - {event.payload}")
-        elif event.event_type in [EventType.SYSTEM_SHUTDOWN, EventType.SYSTEM_RESTART]:
-            self.logger.info(f"System event: {event.event_type.value}")
-        else:
-            self.logger.debug(f"Event: {event.event_type.value} from {event.source}")
+
+        # Log based on event type; lazy %-args defer interpolation to
+        # the handler, and the DEBUG guard skips the common case cheaply
+        event_type = event.event_type
+        if event_type in self._WARNING_EVENTS:
+            self.logger.warning("Event: %s - %s", event_type.value, event.payload)
+        elif event_type in self._INFO_EVENTS:
+            self.logger.info("System event: %s", event_type.value)
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Event: %s from %s", event_type.value, event.source)
     
     def start(self):
         """Start the logging service."""
+        # After a stop() the listener is gone while the root QueueHandler
+        # keeps enqueueing into a queue nobody drains - rebuild the whole
+        # queue/listener pipeline before logging anything
+        if self._log_listener is None:
+            self._setup_logging()
+
         self.logger.info("LoggingService started")
         
         publish_event = self.event_bus.publish
@@ -179,19 +354,49 @@ class LoggingService:
     
     def stop(self):
         """Stop the logging service."""
-        # Flush all handlers
+        self.logger.info("LoggingService stopped")
+
+        self._shutdown_listener()
+
         for handler in logging.getLogger().handlers:
             handler.flush()
         
-        self.logger.info("LoggingService stopped")
-        
         publish_event = self.event_bus.publish
         publish_event(
             EventType.SERVICE_STOPPED,
             {"service": "logging_service"},
             source="logging_service"
         )
-    
+
+    # File buffer sizing: flush after this many records, or on the timer,
+    # whichever comes first
+    _FLUSH_CAPACITY = 1024
+    _FLUSH_INTERVAL = 0.25  # seconds
+
+    def _schedule_flush(self):
+        """Flush the file buffer and re-arm the timer."""
+        buffer = self._file_buffer
+        if buffer is None:
+            return
+        buffer.flush()
+        self._flush_timer = threading.Timer(self._FLUSH_INTERVAL, self._schedule_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _shutdown_listener(self):
+        """Drain the queue onto the real handlers and flush them (idempotent)."""
+        listener = self._log_listener
+        if listener is None:
+            return
+        self._log_listener = None
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._file_buffer = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
     def health_check(self) -> bool:
         """Check service health."""
         # Logging is always healthy if we got here
@@ -4,6 +4,7 @@ Full execution engine with dry-run, rollback, and step-level traceability
 """
 import asyncio
 import logging
+import re
 import shutil
 import json
 from pathlib import Path
@@ -482,7 +483,12 @@ class MCPExecutionEngine:
     """
     Enhanced MCP Execution Engine with full traceability and rollback.
     """
-    
+
+    # Steps explicitly tagged "[parallel]" (or "parallel:") may overlap;
+    # a "depends on step N" reference forces a step back to sequential
+    _PARALLEL_RE = re.compile(r'^(?:\[parallel\]|parallel:)\s*', re.IGNORECASE)
+    _DEPENDS_RE = re.compile(r'\bdepends\s+on\s+step\s+\d+\b', re.IGNORECASE)
+
     def __init__(
         self,
         vault_path: str,
@@ -524,6 +530,13 @@ class MCPExecutionEngine:
     async def start(self):
         """Start the execution engine."""
         self._running = True
+
+        # Run new tasks inline to their first suspension (Python 3.12+):
+        # dry-run steps that never await complete without ever touching
+        # the loop's ready queue
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         self.logger.info(f"MCPExecutionEngine started (mode={self.execution_mode.value})")
         
         publish_event(
@@ -601,30 +614,55 @@ class MCPExecutionEngine:
         # Clear rollback stack
         self.rollback_manager.clear()
         
-        # Execute each step
-        for i, step in enumerate(steps):
-            step_result = await self.step_executor.execute(step, i + 1, plan, action)
-            result.step_results.append(step_result)
-            
-            # Track rollback data
-            if step_result.rollback_data and self.execution_mode != ExecutionMode.DRY_RUN:
-                self.rollback_manager.push_rollback_data(i + 1, step_result.rollback_data)
-            
-            # Update counters
-            if step_result.status == StepStatus.COMPLETED:
-                result.steps_completed += 1
-            elif step_result.status == StepStatus.FAILED:
-                result.steps_failed += 1
-                
-                # Handle failure based on rollback strategy
+        # Execute step groups; independent steps in a group overlap so
+        # the group finishes in max-latency rather than sum-latency
+        aborted = False
+        for group in self._group_independent_steps(steps):
+            if len(group) == 1:
+                step_number, step = group[0]
+                group_results = [
+                    await self.step_executor.execute(step, step_number, plan, action)
+                ]
+            else:
+                # StepExecutor.execute never raises (failures come back
+                # as FAILED results), so no return_exceptions needed
+                group_results = list(await asyncio.gather(*(
+                    self.step_executor.execute(step, step_number, plan, action)
+                    for step_number, step in group
+                )))
+
+            # Record results and rollback data in group-completion order
+            # before handling failures, so completed parallel siblings
+            # are covered by a rollback
+            first_failure: Optional[StepResult] = None
+            for step_result in group_results:
+                result.step_results.append(step_result)
+
+                if step_result.rollback_data and self.execution_mode != ExecutionMode.DRY_RUN:
+                    self.rollback_manager.push_rollback_data(
+                        step_result.step_number, step_result.rollback_data
+                    )
+
+                if step_result.status == StepStatus.COMPLETED:
+                    result.steps_completed += 1
+                elif step_result.status == StepStatus.FAILED:
+                    result.steps_failed += 1
+                    if first_failure is None:
+                        first_failure = step_result
+
+            # Handle failure based on rollback strategy
+            if first_failure is not None:
                 if rollback_strategy == RollbackStrategy.AUTOMATIC:
-                    self.logger.warning(f"Step {i + 1} failed, initiating rollback...")
+                    self.logger.warning(f"Step {first_failure.step_number} failed, initiating rollback...")
                     await self._perform_rollback(result)
-                    break
+                    aborted = True
                 elif rollback_strategy == RollbackStrategy.MANUAL:
-                    self.logger.error(f"Step {i + 1} failed, manual intervention required")
+                    self.logger.error(f"Step {first_failure.step_number} failed, manual intervention required")
                     result.status = "failed_manual_intervention"
-                    break
+                    aborted = True
+
+            if aborted:
+                break
         
         # Determine final status
         if result.steps_failed == 0:
@@ -670,6 +708,43 @@ class MCPExecutionEngine:
             f"Rollback completed: {result.steps_rolled_back}/{len(rollback_results)} steps rolled back"
         )
     
+    def _group_independent_steps(self, steps: List[str]) -> List[List[tuple]]:
+        """
+        Group steps for dispatch, preserving original step numbering.
+
+        Consecutive steps tagged "[parallel]" form one group and run
+        concurrently; anything else (including steps that reference
+        "depends on step N") runs as a group of one, so unmarked plans
+        keep their sequential semantics.
+
+        Args:
+            steps: Parsed step descriptions
+
+        Returns:
+            List of groups, each a list of (step_number, step) tuples
+        """
+        groups: List[List[tuple]] = []
+        current: List[tuple] = []
+        current_parallel = False
+
+        for step_number, step in enumerate(steps, start=1):
+            marked = bool(self._PARALLEL_RE.match(step))
+            step = self._PARALLEL_RE.sub('', step, count=1)
+            independent = marked and not self._DEPENDS_RE.search(step)
+
+            if independent and current_parallel:
+                current.append((step_number, step))
+            else:
+                if current:
+                    groups.append(current)
+                current = [(step_number, step)]
+                current_parallel = independent
+
+        if current:
+            groups.append(current)
+
+        return groups
+
     def _parse_steps(self, steps_text: str) -> List[str]:
         """Parse steps from plan text."""
         steps = []
@@ -712,12 +787,41 @@ class MCPExecutionEngine:
         self.set_execution_mode(ExecutionMode.SIMULATED)
 
 
+def _install_uvloop() -> bool:
+    """
+    Install uvloop's event loop policy when uvloop is available.
+
+    Must run before the entry point calls asyncio.run(); it has no
+    effect on a loop that is already running. No-op (returning False)
+    when uvloop is not installed, e.g. on Windows.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 # Factory function
 def create_mcp_execution_engine(
     vault_path: str,
     config_path: str = "./config.yaml",
-    dry_run: bool = True
+    dry_run: bool = True,
+    use_uvloop: bool = True
 ) -> MCPExecutionEngine:
-    """Factory function to create MCPExecutionEngine."""
+    """
+    Factory function to create MCPExecutionEngine.
+
+    By default this also installs uvloop (when available) as the event
+    loop policy, which cuts task scheduling overhead for plans with
+    many small I/O-bound steps; pass use_uvloop=False to keep the
+    stdlib loop.
+    """
+    if use_uvloop:
+        _install_uvloop()
     mode = ExecutionMode.DRY_RUN if dry_run else ExecutionMode.SIMULATED
     return MCPExecutionEngine(vault_path, config_path, mode)
@@ -4,6 +4,7 @@ Message monitoring for WhatsApp Business API integration
 """
 import asyncio
 import logging
+import re
 from pathlib import Path
 from typing import Dict, Any, Optional
 import yaml
@@ -29,7 +30,17 @@ class WhatsAppWatcher:
     Note: This is a stub for future WhatsApp Business API integration.
     Currently operates in simulation mode.
     """
-    
+
+    # One compiled scan over the message instead of a substring pass
+    # per keyword; mirrors the GmailWatcher classifier
+    _ACTION_RE = re.compile(
+        r'(?P<meeting_request>meeting|schedule|call)'
+        r'|(?P<report_generation>report|summary)'
+        r'|(?P<data_analysis>analyze|data)'
+        r'|(?P<document_creation>document|create)',
+        re.IGNORECASE
+    )
+
     def __init__(self, config_path: str = "./config.yaml"):
         self.config_path = config_path
         self.config = {}
@@ -181,18 +192,11 @@ class WhatsAppWatcher:
     
     def _determine_action_type(self, content: str) -> str:
         """Determine action type from message content."""
-        content_lower = content.lower()
-        
-        if any(kw in content_lower for kw in ['meeting', 'schedule', 'call']):
-            return 'meeting_request'
-        elif any(kw in content_lower for kw in ['report', 'summary']):
-            return 'report_generation'
-        elif any(kw in content_lower for kw in ['analyze', 'data']):
-            return 'data_analysis'
-        elif any(kw in content_lower for kw in ['document', 'create']):
-            return 'document_creation'
-        else:
-            return 'email_response'
+        # Among all keyword hits, the earliest-declared group decides -
+        # category priority, not whichever keyword happens to come first
+        match = min(self._ACTION_RE.finditer(content),
+                    key=lambda m: m.lastindex, default=None)
+        return match.lastgroup if match else 'email_response'
     
     def _save_action_file(self, action: ActionFile) -> Path:
         """Save action file to Needs_Action folder."""